@@ -1,6 +1,26 @@
 from django.apps import AppConfig
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
+
+    def ready(self):
+        from apps.accounts import caches, checks  # noqa: F401
+        from apps.accounts.helpers import TokenHelper
+        from apps.accounts.models import User
+        from apps.accounts.signals import privileges_changed
+        from common.signals import rows_loaded
+
+        pre_save.connect(TokenHelper.revoke_changed_user, sender=User)
+        post_delete.connect(TokenHelper.revoke_deleted_user, sender=User)
+        privileges_changed.connect(TokenHelper.revoke_updated_users, sender=User)
+        post_save.connect(caches.invalidate_user, sender=User)
+        post_delete.connect(caches.invalidate_user, sender=User)
+        privileges_changed.connect(caches.invalidate_users, sender=User)
+        rows_loaded.connect(caches.invalidate_loaded_users, sender=User)
+        user_logged_out.connect(caches.invalidate_session)
+        for field in User._meta.many_to_many:
+            m2m_changed.connect(caches.touch_users, sender=field.remote_field.through)
@@ -0,0 +1,30 @@
+from django.core import signing
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.accounts.helpers import TokenHelper
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        header = get_authorization_header(request).split()
+        if not header or header[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(header) != 2:
+            raise AuthenticationFailed('Invalid token header.')
+
+        try:
+            claims = TokenHelper.load(header[1].decode())
+        except (signing.BadSignature, UnicodeError):
+            raise AuthenticationFailed('Invalid or expired token.')
+
+        if not claims.get('is_active') or TokenHelper.is_revoked(claims):
+            raise AuthenticationFailed('Token has been revoked.')
+
+        return TokenHelper.get_user(claims), claims
+
+    def authenticate_header(self, request):
+        return self.keyword
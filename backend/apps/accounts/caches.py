@@ -0,0 +1,118 @@
+import copy
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import User
+
+VERSION_KEY = 'auth:user:{pk}:version'
+
+
+class UserCache:
+    def __init__(self) -> None:
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, session_key):
+        with self.lock:
+            entry = self.entries.get(session_key)
+            if entry is None:
+                return None
+
+            expires, user, version = entry
+            if expires <= time.monotonic():
+                del self.entries[session_key]
+                return None
+
+        if get_version(user.pk) != version:
+            self.delete(session_key)
+            return None
+        return copy.copy(user)
+
+    def set(self, session_key, user, version) -> None:
+        now = time.monotonic()
+        with self.lock:
+            if len(self.entries) >= settings.AUTH_USER_CACHE_MAX_SIZE:
+                self.entries = {key: entry for key, entry in self.entries.items() if entry[0] > now}
+            while len(self.entries) >= settings.AUTH_USER_CACHE_MAX_SIZE:
+                del self.entries[next(iter(self.entries))]
+
+            self.entries[session_key] = (now + settings.AUTH_USER_CACHE_TIMEOUT, copy.copy(user), version)
+
+    def delete(self, session_key) -> None:
+        with self.lock:
+            self.entries.pop(session_key, None)
+
+    def delete_user(self, pk) -> None:
+        with self.lock:
+            self.entries = {key: entry for key, entry in self.entries.items() if entry[1].pk != pk}
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+users = UserCache()
+
+
+def get_version(pk) -> int:
+    key = VERSION_KEY.format(pk=pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def expire_user(pk) -> None:
+    users.delete_user(pk)
+    key = VERSION_KEY.format(pk=pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def invalidate_user(sender, instance, **kwargs) -> None:
+    expire_user(instance.pk)
+    transaction.on_commit(lambda: expire_user(instance.pk))
+
+
+def invalidate_users(sender, users, **kwargs) -> None:
+    for user in users:
+        invalidate_user(sender, user)
+
+
+def invalidate_loaded_users(sender, pks, **kwargs) -> None:
+    for pk in pks:
+        expire_user(pk)
+
+
+def invalidate_session(sender, request, user=None, **kwargs) -> None:
+    session = getattr(request, 'session', None)
+    if session is not None and session.session_key:
+        users.delete(session.session_key)
+    if user is not None:
+        expire_user(user.pk)
+
+
+def touch_users(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+
+    if not reverse:
+        pks = [instance.pk]
+    elif pk_set is not None:
+        pks = list(pk_set)
+    else:
+        field = next(field for field in User._meta.many_to_many if field.remote_field.through is sender)
+        pks = list(User.objects.filter(**{field.name: instance}).values_list('pk', flat=True))
+
+    User.objects.filter(pk__in=pks).update(updated_at=timezone.now())
+    for pk in pks:
+        expire_user(pk)
+        transaction.on_commit(lambda pk=pk: expire_user(pk))
@@ -0,0 +1,16 @@
+from django.core.checks import Error, Tags, register
+
+from apps.accounts.helpers import TOKEN_CACHE_ALIAS
+from common import caches
+
+
+@register(Tags.caches, deploy=True)
+def check_token_cache(app_configs, **kwargs):
+    if caches.is_shared(TOKEN_CACHE_ALIAS):
+        return []
+
+    return [Error(
+        f'Token revocations need the "{TOKEN_CACHE_ALIAS}" cache to be shared by every worker.',
+        hint='Point TOKEN_CACHE_URL at Redis or Memcached; a revoke in a process-local cache reaches one worker only.',
+        id='accounts.E001',
+    )]
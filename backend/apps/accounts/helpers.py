@@ -0,0 +1,89 @@
+import secrets
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import caches
+from django.db import router, transaction
+
+from apps.accounts.models import REVOKING_FIELDS, User
+
+TOKEN_SALT = 'apps.accounts.token'
+TOKEN_CACHE_ALIAS = 'tokens'
+REVOKED_TOKEN_KEY = 'token:revoked:{jti}'
+REVOKED_USER_KEY = 'token:not-before:{uuid}'
+
+
+class TokenHelper:
+    @staticmethod
+    def issue(user: User) -> dict:
+        claims = {
+            'id': user.pk,
+            'uuid': user.uuid,
+            'is_staff': user.is_staff,
+            'is_superuser': user.is_superuser,
+            'is_active': user.is_active,
+            'iat': time.time(),
+            'jti': secrets.token_urlsafe(12),
+        }
+        return {'token': signing.dumps(claims, salt=TOKEN_SALT), 'expires_in': settings.SIGNED_TOKEN_MAX_AGE}
+
+    @staticmethod
+    def load(token: str) -> dict:
+        return signing.loads(token, salt=TOKEN_SALT, max_age=settings.SIGNED_TOKEN_MAX_AGE)
+
+    @staticmethod
+    def is_revoked(claims: dict) -> bool:
+        token_key = REVOKED_TOKEN_KEY.format(jti=claims['jti'])
+        user_key = REVOKED_USER_KEY.format(uuid=claims['uuid'])
+        values = caches[TOKEN_CACHE_ALIAS].get_many([token_key, user_key])
+        return token_key in values or values.get(user_key, 0) > claims['iat']
+
+    @staticmethod
+    def revoke(claims: dict) -> None:
+        timeout = claims['iat'] + settings.SIGNED_TOKEN_MAX_AGE - time.time()
+        caches[TOKEN_CACHE_ALIAS].set(REVOKED_TOKEN_KEY.format(jti=claims['jti']), True, max(int(timeout) + 1, 1))
+
+    @staticmethod
+    def revoke_user(user: User) -> None:
+        key = REVOKED_USER_KEY.format(uuid=user.uuid)
+        caches[TOKEN_CACHE_ALIAS].set(key, time.time(), settings.SIGNED_TOKEN_MAX_AGE + 1)
+
+    @staticmethod
+    def get_user(claims: dict) -> User:
+        values = {
+            'id': claims['id'],
+            'uuid': claims['uuid'],
+            'is_staff': claims['is_staff'],
+            'is_superuser': claims['is_superuser'],
+            'is_active': claims['is_active'],
+        }
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+        return User.from_db(router.db_for_read(User), field_names, [values[name] for name in field_names])
+
+    @staticmethod
+    def revoke_changed_user(sender, instance, raw=False, update_fields=None, **kwargs) -> None:
+        if raw or instance.pk is None:
+            return
+        if update_fields is not None and not set(update_fields) & set(REVOKING_FIELDS):
+            return
+
+        stored = sender._base_manager.filter(pk=instance.pk).values(*REVOKING_FIELDS).first()
+        if stored is None or all(stored[field] == getattr(instance, field) for field in REVOKING_FIELDS):
+            return
+
+        TokenHelper.revoke_users([instance])
+
+    @staticmethod
+    def revoke_deleted_user(sender, instance, **kwargs) -> None:
+        TokenHelper.revoke_users([instance])
+
+    @staticmethod
+    def revoke_updated_users(sender, users, **kwargs) -> None:
+        TokenHelper.revoke_users(users)
+
+    @staticmethod
+    def revoke_users(users) -> None:
+        for user in users:
+            TokenHelper.revoke_user(user)
+            transaction.on_commit(lambda user=user: TokenHelper.revoke_user(user))
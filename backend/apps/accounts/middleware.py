@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.functional import SimpleLazyObject
+
+from apps.accounts.caches import get_version, users
+
+
+def get_user(request, session_key):
+    if not hasattr(request, '_cached_user'):
+        user = users.get(session_key) if session_key else None
+        if user is None:
+            pk = request.session.get(auth.SESSION_KEY) if session_key else None
+            version = get_version(pk) if pk is not None else None
+            user = auth.get_user(request)
+            if version is not None and user.is_authenticated:
+                users.set(session_key, user, version)
+        request._cached_user = user
+    return request._cached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    def process_request(self, request):
+        super().process_request(request)
+        session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        request.user = SimpleLazyObject(lambda: get_user(request, session_key))
@@ -1,12 +1,34 @@
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
 from django.db import models
 
+from apps.accounts.signals import privileges_changed
+from common.fields import PrefixedUUIDField
 from common.utils import generate_uuid
 
+REVOKING_FIELDS = ('password', 'is_active', 'is_staff', 'is_superuser')
+
+
+class UserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        if not set(kwargs) & set(REVOKING_FIELDS):
+            return super().update(**kwargs)
+
+        users = list(self.only('pk', 'uuid'))
+        count = super().update(**kwargs)
+        privileges_changed.send(sender=self.model, users=users)
+        return count
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    pass
+
 
 class UserProfile(AbstractUser):
-    uuid = models.CharField(max_length=100, editable=False, unique=True)
+    uuid = PrefixedUUIDField(editable=False, unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = UserManager()
 
     class Meta:
         db_table = 'accounts_user_profile'
@@ -1,6 +1,8 @@
+from django.contrib.auth import authenticate
 from rest_framework import serializers
 
 from apps.accounts.models import User
+from common.serializers import CompiledModelSerializer
 
 
 class UserCreateSerializer(serializers.ModelSerializer):
@@ -12,15 +14,30 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return User.objects.create_user(**validated_data)
 
 
-class UserReadableSerializer(serializers.ModelSerializer):
+class UserReadableSerializer(CompiledModelSerializer):
     full_name = serializers.CharField(source='get_full_name')
 
     class Meta:
         model = User
-        exclude = ['id', 'first_name', 'last_name', 'password']
+        exclude = ['id', 'first_name', 'last_name', 'password', 'updated_at']
+        compiled_sources = {
+            'full_name': ['first_name', 'last_name'],
+        }
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['username', 'first_name', 'last_name', 'email']
+
+
+class TokenCreateSerializer(serializers.Serializer):
+    username = serializers.CharField()
+    password = serializers.CharField(write_only=True, style={'input_type': 'password'}, trim_whitespace=False)
+
+    def validate(self, data):
+        user = authenticate(self.context.get('request'), username=data['username'], password=data['password'])
+        if user is None:
+            raise serializers.ValidationError('Unable to log in with provided credentials.')
+
+        return {'user': user}
@@ -1,8 +1,26 @@
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
-
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.test import APITestCase, APIRequestFactory
+
+from apps.accounts.authentication import SignedTokenAuthentication
+from apps.accounts.caches import VERSION_KEY, users
+from apps.accounts.checks import check_token_cache
+from apps.accounts.helpers import TOKEN_CACHE_ALIAS, TokenHelper
 from apps.accounts.models import User
+from apps.accounts.serializers import UserReadableSerializer
 
 
 class AccountAPITestCase(APITestCase):
@@ -38,6 +56,20 @@ class AccountAPITestCase(APITestCase):
         self.assertEqual(data.get('first_name'), user.first_name)
         self.assertEqual(data.get('last_name'), user.last_name)
         self.assertEqual(data.get('email'), user.email)
+        self.assertEqual(response['Preference-Applied'], 'return=minimal')
+        self.assertTrue(response['Location'].endswith(reverse('user-detail', kwargs={'uuid': user.uuid})))
+
+    def test_create_user_with_representation(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        data = {'username': 'john-doe', 'first_name': 'John', 'password': 'john_password'}
+        response = self.client.post(reverse('user-list'), data, format='json', HTTP_PREFER='return=representation')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response['Preference-Applied'], 'return=representation')
+
+        user = User.objects.get(username='john-doe')
+        self.assertEqual(response.data.get('uuid'), user.uuid)
+        self.assertEqual(response.data.get('full_name'), 'John')
+        self.assertNotIn('password', response.data)
 
     def test_create_user_by_non_admin(self) -> None:
         self.client.login(username='regular_user', password='regular_password')
@@ -86,6 +118,105 @@ class AccountAPITestCase(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_get_all_users_with_cursor_pagination(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('user-list')
+        response = self.client.get(url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(
+            [user.get('uuid') for user in response.data.get('results')],
+            [self.regular_user.uuid, self.admin_user.uuid]
+        )
+
+    def test_get_me_not_modified(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('user-me')
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.admin_user.refresh_from_db()
+        self.admin_user.email = 'administrator@example.com'
+        self.admin_user.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_me_etag_depends_on_user(self) -> None:
+        other_admin = User.objects.create_superuser(username='other_admin', password='other_password')
+        joined = timezone.now()
+        etags = []
+        for user in (self.admin_user, other_admin):
+            self.client.force_login(user)
+            User.objects.update(date_joined=joined, last_login=None, updated_at=joined)
+            users.clear()
+            etags.append(self.client.get(reverse('user-me'))['ETag'])
+        self.assertNotEqual(*etags)
+
+    def test_get_a_user_not_modified_until_groups_change(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('user-detail', kwargs={'uuid': self.regular_user.uuid})
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        group = Group.objects.create(name='editors')
+        for change in (lambda: self.regular_user.groups.add(group), lambda: group.user_set.clear()):
+            change()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            etag = response['ETag']
+
+    def test_compiled_user_serializer_matches_serializer(self) -> None:
+        self.client.login(username='regular_user', password='regular_password')
+        self.regular_user.groups.add(Group.objects.create(name='editors'), Group.objects.create(name='viewers'))
+        self.regular_user.user_permissions.add(*Permission.objects.filter(codename__startswith='change_')[:3])
+        queryset = User.objects.all()
+        plan = UserReadableSerializer.get_plan()
+        self.assertIsNotNone(plan)
+        self.assertEqual(
+            plan.render(UserReadableSerializer(), queryset.values(*plan.get_columns())),
+            UserReadableSerializer(queryset, many=True).data
+        )
+
+    def test_get_users_through_async_viewset(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        self.regular_user.groups.add(Group.objects.create(name='editors'))
+
+        for name, kwargs in (('list', {}), ('detail', {'uuid': self.regular_user.uuid}), ('me', {})):
+            response = self.client.get(reverse(f'async-user-{name}', kwargs=kwargs))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data, self.client.get(reverse(f'user-{name}', kwargs=kwargs)).data)
+
+    def test_get_all_users_through_async_viewset_by_non_admin(self) -> None:
+        self.client.login(username='regular_user', password='regular_password')
+        response = self.client.get(reverse('async-user-list'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_users_with_constant_queries(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        self.client.get(reverse('user-me'))
+        groups = [Group.objects.create(name=f'group-{index}') for index in range(3)]
+        permissions = Permission.objects.all()[:3]
+
+        for count in (2, 20):
+            while User.objects.count() < count:
+                user = User.objects.create_user(username=f'user-{User.objects.count()}')
+                user.groups.add(*groups)
+                user.user_permissions.add(*permissions)
+
+            with self.assertNumQueries(5):
+                response = self.client.get(reverse('user-list'))
+            self.assertEqual(len(response.data['results']), count)
+
+        url = reverse('user-detail', kwargs={'uuid': user.uuid})
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data['groups']), 3)
+
+        with self.assertNumQueries(2):
+            self.client.get(reverse('user-me'))
+
     def test_get_a_user_by_admin(self) -> None:
         self.client.login(username='admin_user', password='admin_password')
         url = reverse('user-detail', kwargs={'uuid': self.admin_user.uuid})
@@ -170,3 +301,275 @@ class AccountAPITestCase(APITestCase):
         url = reverse('user-detail', kwargs={'uuid': self.regular_user.uuid})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TokenAPITestCase(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        caches[TOKEN_CACHE_ALIAS].clear()
+        self.admin_user = User.objects.create_superuser(
+            username='admin_user',
+            email='admin@example.com',
+            password='admin_password'
+        )
+        self.regular_user = User.objects.create_user(
+            username='regular_user',
+            email='regular@example.com',
+            password='regular_password'
+        )
+
+    def get_token(self, username: str, password: str) -> str:
+        response = self.client.post(reverse('token-list'), {'username': username, 'password': password})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['token']
+
+    def test_issue_token_with_invalid_credentials(self) -> None:
+        response = self.client.post(reverse('token-list'), {'username': 'admin_user', 'password': 'wrong'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_authenticate_without_queries(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        request = Request(
+            APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'),
+            authenticators=[SignedTokenAuthentication()]
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(request.user.pk, self.admin_user.pk)
+            self.assertEqual(request.user.uuid, self.admin_user.uuid)
+            self.assertTrue(IsAdminUser().has_permission(request, None))
+
+    def test_get_all_users_with_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        token = self.get_token('regular_user', 'regular_password')
+        response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_me_with_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        for name in ('user-me', 'async-user-me'):
+            response = self.client.get(reverse(name), HTTP_AUTHORIZATION=f'Bearer {token}')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['username'], 'admin_user')
+            self.assertEqual(response.data['email'], 'admin@example.com')
+
+    def test_create_experience_with_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        data = {
+            'job_title': 'Data Engineer',
+            'description': '',
+            'company_name': 'DataWorks Co., Ltd.',
+            'started_month': 1,
+            'ended_month': None,
+            'started_year': 2021,
+            'ended_year': None,
+            'is_still_in_role': True
+        }
+
+        response = self.client.post(
+            reverse('experience-list'), data, format='json', HTTP_AUTHORIZATION=f'Bearer {token}'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.admin_user.experiences.get().created_user, self.admin_user)
+
+    def test_reject_tampered_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        response = self.client.get(reverse('user-me'), HTTP_AUTHORIZATION=f'Bearer {token[:-1]}x')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_reject_expired_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        with override_settings(SIGNED_TOKEN_MAX_AGE=-1):
+            response = self.client.get(reverse('user-me'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_refresh_token_revokes_previous_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        response = self.client.post(reverse('token-refresh'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        refreshed = response.data['token']
+
+        response = self.client.get(reverse('user-me'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(reverse('user-me'), HTTP_AUTHORIZATION=f'Bearer {refreshed}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_promotion_requires_a_new_token(self) -> None:
+        token = self.get_token('regular_user', 'regular_password')
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.regular_user.pk).update(is_staff=True, updated_at=timezone.now())
+
+        response = self.client.post(reverse('token-refresh'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        token = self.get_token('regular_user', 'regular_password')
+        response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_revoke_token(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        response = self.client.post(reverse('token-revoke'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self.client.get(reverse('user-me'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_revocation_survives_response_cache_flush(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        self.client.post(reverse('token-revoke'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        cache.clear()
+
+        response = self.client.get(reverse('user-me'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_token_cache_must_be_shared(self) -> None:
+        self.assertEqual([error.id for error in check_token_cache(None)], ['accounts.E001'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory}
+            with override_settings(CACHES={**settings.CACHES, TOKEN_CACHE_ALIAS: backend}):
+                self.assertEqual(check_token_cache(None), [])
+
+    def test_privilege_changes_revoke_tokens(self) -> None:
+        changes = [
+            lambda user: setattr(user, 'is_staff', False),
+            lambda user: setattr(user, 'is_active', False),
+            lambda user: user.set_password('changed_password'),
+        ]
+        for index, change in enumerate(changes):
+            staff_user = User.objects.create_user(username=f'staff_{index}', password='staff_password', is_staff=True)
+            token = self.get_token(f'staff_{index}', 'staff_password')
+            self.assertEqual(
+                self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}').status_code,
+                status.HTTP_200_OK
+            )
+
+            change(staff_user)
+            with self.captureOnCommitCallbacks(execute=True):
+                staff_user.save()
+            response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_queryset_updates_and_deletes_revoke_tokens(self) -> None:
+        changes = [
+            lambda queryset: queryset.update(is_staff=False),
+            lambda queryset: queryset.update(is_active=False),
+            lambda queryset: queryset.delete(),
+        ]
+        for index, change in enumerate(changes):
+            User.objects.create_user(username=f'staff_{index}', password='staff_password', is_staff=True)
+            token = self.get_token(f'staff_{index}', 'staff_password')
+
+            with self.captureOnCommitCallbacks(execute=True):
+                change(User.objects.filter(username=f'staff_{index}'))
+            response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unrelated_changes_keep_tokens(self) -> None:
+        token = self.get_token('admin_user', 'admin_password')
+        self.admin_user.first_name = 'Admin'
+        self.admin_user.save()
+        self.assertEqual(TokenHelper.get_user(TokenHelper.load(token)).is_active, True)
+
+        response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_delete_user_revokes_tokens(self) -> None:
+        staff_user = User.objects.create_user(username='staff_user', password='staff_password', is_staff=True)
+        token = self.get_token('staff_user', 'staff_password')
+        response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.login(username='admin_user', password='admin_password')
+        response = self.client.delete(reverse('user-detail', kwargs={'uuid': staff_user.uuid}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.client.logout()
+
+        response = self.client.get(reverse('user-list'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CachedAuthenticationTestCase(APITestCase):
+    def setUp(self) -> None:
+        users.clear()
+        self.admin_user = User.objects.create_superuser(
+            username='admin_user',
+            email='admin@example.com',
+            password='admin_password'
+        )
+        self.client.login(username='admin_user', password='admin_password')
+
+    def get_auth_queries(self, url: str) -> list:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            query['sql'] for query in context.captured_queries
+            if 'django_session' in query['sql'] or 'WHERE "accounts_user_profile"."id" =' in query['sql']
+        ]
+
+    def test_repeat_requests_skip_session_and_user_queries(self) -> None:
+        self.assertEqual(len(self.get_auth_queries(reverse('user-me'))), 2)
+        self.assertEqual(self.get_auth_queries(reverse('user-me')), [])
+        self.assertEqual(self.get_auth_queries(reverse('user-list')), [])
+
+    def test_cached_user_is_not_shared_between_requests(self) -> None:
+        self.client.get(reverse('user-me'))
+        first = users.get(self.client.session.session_key)
+        first.username = 'changed'
+
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.data['username'], 'admin_user')
+
+    def test_save_invalidates_cached_user(self) -> None:
+        self.client.get(reverse('user-me'))
+        url = reverse('user-detail', kwargs={'uuid': self.admin_user.uuid})
+        response = self.client.patch(url, {'first_name': 'Ada'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.data['full_name'], 'Ada')
+
+    def test_password_change_invalidates_cached_user(self) -> None:
+        self.client.get(reverse('user-me'))
+        self.admin_user.set_password('new_password')
+        self.admin_user.save()
+
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_logout_invalidates_cached_user(self) -> None:
+        self.client.get(reverse('user-me'))
+        session_key = self.client.session.session_key
+        self.client.post(reverse('rest_framework:logout'))
+
+        self.assertIsNone(users.get(session_key))
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session_key
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_changes_in_another_process_invalidate_cached_user(self) -> None:
+        self.client.get(reverse('user-me'))
+        # Written by another process: nothing local is expired, only the shared version moves below
+        User._base_manager.filter(pk=self.admin_user.pk).update(password=make_password('changed_password'))
+        self.assertEqual(self.get_auth_queries(reverse('user-me')), [])
+
+        cache.incr(VERSION_KEY.format(pk=self.admin_user.pk))
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_logout_in_another_process_invalidates_cached_user(self) -> None:
+        self.client.get(reverse('user-me'))
+        session_key = self.client.session.session_key
+
+        with mock.patch.object(users, 'delete'), mock.patch.object(users, 'delete_user'):
+            self.client.post(reverse('rest_framework:logout'))
+        self.assertIn(session_key, users.entries)
+
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session_key
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
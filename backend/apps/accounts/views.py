@@ -1,23 +1,83 @@
+from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.viewsets import ModelViewSet
+from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
+from apps.accounts.authentication import SignedTokenAuthentication
+from apps.accounts.helpers import TokenHelper
 from apps.accounts.mixins import CreateModelMixin, UpdateModelMixin
 from apps.accounts.models import User
 from apps.accounts.serializers import (
-    UserReadableSerializer, UserCreateSerializer, UserUpdateSerializer
+    UserReadableSerializer, UserCreateSerializer, UserUpdateSerializer, TokenCreateSerializer
 )
-from common.mixins import ReadWritableSerializerMixin
+from common.mixins import AsyncViewSetMixin, ConditionalGetMixin, ReadWritableSerializerMixin
 
 
-class UserViewSet(CreateModelMixin, UpdateModelMixin, ReadWritableSerializerMixin, ModelViewSet):
+class UserViewSet(CreateModelMixin, UpdateModelMixin, ConditionalGetMixin, ReadWritableSerializerMixin, ModelViewSet):
     queryset = User.objects.all()
     create_serializer = UserCreateSerializer
     update_serializer = UserUpdateSerializer
     readable_serializer = UserReadableSerializer
     lookup_field = 'uuid'
+    conditional_fields = ('date_joined', 'last_login', 'updated_at')
 
     @action(detail=False)
     def me(self, request):
-        serializer = self.get_serializer(request.user)
-        return Response(serializer.data)
+        user = self.get_request_user()
+        self.set_validators(request, self.get_user_conditional_values(user))
+        return self.get_not_modified_response(request) or Response(self.serialize(user))
+
+    def get_user_conditional_values(self, user):
+        return {'uuid': user.uuid, **{field: getattr(user, field) for field in self.conditional_fields}}
+
+    def get_request_user(self):
+        user = self.request.user
+        deferred_fields = user.get_deferred_fields()
+        if deferred_fields:
+            user.refresh_from_db(fields=deferred_fields)
+        return user
+
+
+class AsyncUserViewSet(AsyncViewSetMixin, UserViewSet):
+    @action(detail=False)
+    async def me(self, request):
+        user = await self.aget_request_user()
+        self.set_validators(request, self.get_user_conditional_values(user))
+        return self.get_not_modified_response(request) or Response(await self.aserialize(user))
+
+    async def aget_request_user(self):
+        user = self.request.user
+        deferred_fields = user.get_deferred_fields()
+        if deferred_fields:
+            await user.arefresh_from_db(fields=deferred_fields)
+        return user
+
+
+class TokenViewSet(GenericViewSet):
+    serializer_class = TokenCreateSerializer
+    permission_classes = [AllowAny]
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(TokenHelper.issue(serializer.validated_data['user']), status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
+    def refresh(self, request, *args, **kwargs):
+        user = User.objects.filter(pk=request.user.pk, is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed('User is inactive or deleted.')
+
+        if isinstance(request.successful_authenticator, SignedTokenAuthentication):
+            TokenHelper.revoke(request.auth)
+        return Response(TokenHelper.issue(user))
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
+    def revoke(self, request, *args, **kwargs):
+        if isinstance(request.successful_authenticator, SignedTokenAuthentication):
+            TokenHelper.revoke(request.auth)
+        else:
+            TokenHelper.revoke_user(request.user)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,56 @@
+from django import forms
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
+
+from apps.jobs.models import Experience
+from common.filters import FullTextSearchFilter
+from common.paginations import PageNumberPagination
+
+
+class MonthsFilter(filters.NumberFilter):
+    field_class = forms.IntegerField
+
+
+class ExperienceFilterSet(filters.FilterSet):
+    min_months = MonthsFilter(method='filter_months', min_value=0)
+    max_months = MonthsFilter(method='filter_months', min_value=0)
+    ordering = filters.ChoiceFilter(
+        method='filter_ordering',
+        choices=[('duration', 'Duration'), ('-duration', 'Duration (descending)')]
+    )
+
+    class Meta:
+        model = Experience
+        fields = []
+
+    def filter_months(self, queryset, name, value):
+        lookup = 'gte' if name == 'min_months' else 'lte'
+        started_lookup = 'lte' if name == 'min_months' else 'gte'
+        return queryset.alias(started_index=self.get_started_index()).filter(
+            Q(is_still_in_role=False, **{f'months_worked__{lookup}': value}) |
+            Q(is_still_in_role=True, **{f'started_index__{started_lookup}': self.get_current_index() - value})
+        )
+
+    def filter_ordering(self, queryset, name, value):
+        params = self.request.query_params
+        if params.get(FullTextSearchFilter.search_param, '').strip():
+            raise ValidationError({name: ['Cannot be combined with search, which orders by rank.']})
+        if PageNumberPagination().is_cursor_requested(self.request):
+            raise ValidationError({name: ['Cannot be combined with cursor pagination.']})
+
+        duration = Case(
+            When(is_still_in_role=True, then=Value(self.get_current_index()) - self.get_started_index()),
+            default=F('months_worked')
+        )
+        return queryset.alias(duration=duration).order_by(value, '-created_at', '-id')
+
+    @staticmethod
+    def get_started_index():
+        return F('started_year') * 12 + F('started_month')
+
+    @staticmethod
+    def get_current_index():
+        current_datetime = timezone.now()
+        return current_datetime.year * 12 + current_datetime.month + 1
@@ -1,5 +1,7 @@
 import calendar
-from typing import Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Iterable, List
 
 from django.utils import timezone
 
@@ -8,36 +10,68 @@ from apps.jobs.models import Experience
 
 class ExperienceHelper:
     @staticmethod
-    def get_working_period(experience: Experience) -> str:
-        total_months_worked = ExperienceHelper.calculate_total_months_worked(experience)
+    def get_working_period(experience: Experience, current_datetime: Optional[datetime] = None) -> str:
+        current_datetime = current_datetime or timezone.now()
+        return ExperienceHelper.format_working_period(
+            experience.started_month,
+            experience.started_year,
+            experience.ended_month,
+            experience.ended_year,
+            experience.is_still_in_role,
+            current_datetime.month if experience.is_still_in_role else None,
+            current_datetime.year if experience.is_still_in_role else None
+        )
+
+    @staticmethod
+    def get_working_periods(
+            experiences: Iterable[Experience],
+            current_datetime: Optional[datetime] = None
+    ) -> List[str]:
+        current_datetime = current_datetime or timezone.now()
+        return [ExperienceHelper.get_working_period(experience, current_datetime) for experience in experiences]
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def format_working_period(
+            started_month: int,
+            started_year: int,
+            ended_month: Optional[int],
+            ended_year: Optional[int],
+            is_still_in_role: bool,
+            current_month: Optional[int],
+            current_year: Optional[int]
+    ) -> str:
+        total_months_worked = (
+            ExperienceHelper.calculate_months_between(started_month, started_year, current_month, current_year)
+            if is_still_in_role
+            else ExperienceHelper.calculate_months_between(started_month, started_year, ended_month, ended_year)
+        )
         years_worked, months_worked = ExperienceHelper.calculate_years_months_worked(total_months_worked)
-        started_month_abbr = ExperienceHelper.get_month_abbr_from_month_number(experience.started_month)
+        started_month_abbr = ExperienceHelper.get_month_abbr_from_month_number(started_month)
         ended = (
             'Present'
-            if experience.is_still_in_role
-            else f'{ExperienceHelper.get_month_abbr_from_month_number(experience.ended_month)} {experience.ended_year}'
+            if is_still_in_role
+            else f'{ExperienceHelper.get_month_abbr_from_month_number(ended_month)} {ended_year}'
         )
-        working_period = f'{started_month_abbr} {experience.started_year} - {ended}'
+        working_period = f'{started_month_abbr} {started_year} - {ended}'
         working_period += ExperienceHelper.append_duration(years_worked, months_worked)
         return working_period
 
     @staticmethod
-    def calculate_total_months_worked(experience: Experience) -> int:
-        current_datetime = timezone.now()
-        started_year = experience.started_year
-        started_month = experience.started_month
-
-        total_months_worked = (
-                ((current_datetime.year - started_year) * 12) +
-                (current_datetime.month - started_month + 1)
-        )
+    def calculate_total_months_worked(experience: Experience, current_datetime: Optional[datetime] = None) -> int:
         if not experience.is_still_in_role:
-            total_months_worked = (
-                    ((experience.ended_year - started_year) * 12) +
-                    (experience.ended_month - started_month + 1)
+            return ExperienceHelper.calculate_months_between(
+                experience.started_month, experience.started_year, experience.ended_month, experience.ended_year
             )
 
-        return total_months_worked
+        current_datetime = current_datetime or timezone.now()
+        return ExperienceHelper.calculate_months_between(
+            experience.started_month, experience.started_year, current_datetime.month, current_datetime.year
+        )
+
+    @staticmethod
+    def calculate_months_between(started_month: int, started_year: int, ended_month: int, ended_year: int) -> int:
+        return ((ended_year - started_year) * 12) + (ended_month - started_month + 1)
 
     @staticmethod
     def calculate_years_months_worked(total_months_worked: int) -> tuple:
@@ -0,0 +1,61 @@
+import random
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.jobs.helpers import ExperienceHelper
+from apps.jobs.models import Experience
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-row and batched working period computation on in-memory experiences.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        experiences = self.build_experiences(rows, random.Random(options['seed']))
+
+        def per_row():
+            for experience in experiences:
+                current_datetime = timezone.now()
+                ExperienceHelper.format_working_period.__wrapped__(
+                    experience.started_month,
+                    experience.started_year,
+                    experience.ended_month,
+                    experience.ended_year,
+                    experience.is_still_in_role,
+                    current_datetime.month if experience.is_still_in_role else None,
+                    current_datetime.year if experience.is_still_in_role else None
+                )
+
+        def batched():
+            ExperienceHelper.get_working_periods(experiences)
+
+        for name, function in (('per-row', per_row), ('batched', batched)):
+            best = min(timeit.repeat(function, number=1, repeat=options['repeat']))
+            self.stdout.write(f'{name}: {best * 1000:.2f} ms per page, {best / rows * 1_000_000:.3f} us per row')
+
+    @staticmethod
+    def build_experiences(rows, randomizer):
+        experiences = []
+        for _ in range(rows):
+            started_year = randomizer.randint(2000, 2024)
+            started_month = randomizer.randint(1, 12)
+            is_still_in_role = randomizer.random() < 0.3
+            ended_year = None if is_still_in_role else randomizer.randint(started_year, 2025)
+            ended_month = None if is_still_in_role else randomizer.randint(
+                started_month if ended_year == started_year else 1, 12
+            )
+            experiences.append(Experience(
+                started_month=started_month,
+                started_year=started_year,
+                ended_month=ended_month,
+                ended_year=ended_year,
+                is_still_in_role=is_still_in_role
+            ))
+        return experiences
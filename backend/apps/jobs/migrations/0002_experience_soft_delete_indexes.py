@@ -0,0 +1,25 @@
+# Generated by Django 4.2.17 on 2026-10-18 06:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('deleted_user__isnull', True)), fields=['-created_at', '-id'], name='jobs_experience_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', False), ('deleted_user__isnull', False)), fields=['-created_at', '-id'], name='jobs_experience_trash_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('deleted_user__isnull', True)), fields=['user', '-created_at', '-id'], name='jobs_experience_user_live_idx'),
+        ),
+    ]
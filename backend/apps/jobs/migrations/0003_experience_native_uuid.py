@@ -0,0 +1,67 @@
+# Generated by Django 4.2.17 on 2026-10-18 07:10
+
+import common.fields
+from django.db import migrations, models
+
+
+def copy_uuid_to_native(apps, schema_editor):
+    Experience = apps.get_model('jobs', 'Experience')
+    rows = []
+
+    for row in Experience.objects.only('uuid').iterator(chunk_size=2000):
+        row.uuid_new = row.uuid
+        rows.append(row)
+        if len(rows) == 2000:
+            Experience.objects.bulk_update(rows, ['uuid_new'])
+            rows = []
+
+    Experience.objects.bulk_update(rows, ['uuid_new'])
+
+
+def copy_uuid_to_varchar(apps, schema_editor):
+    Experience = apps.get_model('jobs', 'Experience')
+    rows = []
+
+    for row in Experience.objects.only('uuid_new').iterator(chunk_size=2000):
+        row.uuid = row.uuid_new
+        rows.append(row)
+        if len(rows) == 2000:
+            Experience.objects.bulk_update(rows, ['uuid'])
+            rows = []
+
+    Experience.objects.bulk_update(rows, ['uuid'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_experience_soft_delete_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experience',
+            name='uuid_new',
+            field=common.fields.PrefixedUUIDField(editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='experience',
+            name='uuid',
+            field=models.CharField(editable=False, max_length=100, null=True, unique=True),
+        ),
+        migrations.RunPython(copy_uuid_to_native, copy_uuid_to_varchar),
+        migrations.RemoveField(
+            model_name='experience',
+            name='uuid',
+        ),
+        migrations.RenameField(
+            model_name='experience',
+            old_name='uuid_new',
+            new_name='uuid',
+        ),
+        migrations.AlterField(
+            model_name='experience',
+            name='uuid',
+            field=common.fields.PrefixedUUIDField(editable=False, unique=True),
+        ),
+    ]
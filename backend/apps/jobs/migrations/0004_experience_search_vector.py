@@ -0,0 +1,75 @@
+# Generated by Django 4.2.17 on 2026-10-18 07:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR = """
+    setweight(to_tsvector('english', coalesce({row}.job_title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}.company_name, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}.description, '')), 'C')
+"""
+
+CREATE_SQL = [
+    f"""
+    CREATE FUNCTION jobs_experience_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {SEARCH_VECTOR.format(row='NEW')};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER jobs_experience_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF job_title, company_name, description, search_vector ON jobs_experience
+    FOR EACH ROW EXECUTE FUNCTION jobs_experience_search_vector_update()
+    """,
+    f'UPDATE jobs_experience SET search_vector = {SEARCH_VECTOR.format(row="jobs_experience")}',
+    'CREATE INDEX jobs_experience_search_idx ON jobs_experience USING gin (search_vector)',
+]
+
+DROP_SQL = [
+    'DROP INDEX IF EXISTS jobs_experience_search_idx',
+    'DROP TRIGGER IF EXISTS jobs_experience_search_vector_trigger ON jobs_experience',
+    'DROP FUNCTION IF EXISTS jobs_experience_search_vector_update()',
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_experience_native_uuid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experience',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='experience',
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        fields=['search_vector'],
+                        name='jobs_experience_search_idx'
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(run_on_postgresql(CREATE_SQL), run_on_postgresql(DROP_SQL)),
+            ],
+        ),
+    ]
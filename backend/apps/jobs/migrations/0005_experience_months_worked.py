@@ -0,0 +1,27 @@
+# Generated by Django 4.2.17 on 2026-10-18 07:05
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_experience_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experience',
+            name='months_worked',
+            field=models.IntegerField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('deleted_user__isnull', True), ('is_still_in_role', False)), fields=['months_worked'], name='jobs_experience_months_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('started_year'), '*', models.Value(12)), '+', models.F('started_month')), condition=models.Q(('deleted_at__isnull', True), ('deleted_user__isnull', True), ('is_still_in_role', True)), name='jobs_experience_started_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.17 on 2026-10-18 09:12
+
+from django.db import migrations
+
+MONTHS_WORKED = """
+    CASE WHEN {row}.is_still_in_role THEN NULL
+    ELSE ({row}.ended_year - {row}.started_year) * 12 + ({row}.ended_month - {row}.started_month + 1) END
+"""
+
+BACKFILL_SQL = f'UPDATE jobs_experience SET months_worked = {MONTHS_WORKED.format(row="jobs_experience")}'
+
+CREATE_SQL = {
+    'postgresql': [
+        f"""
+        CREATE FUNCTION jobs_experience_months_worked_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.months_worked := {MONTHS_WORKED.format(row='NEW')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER jobs_experience_months_worked_trigger
+        BEFORE INSERT OR UPDATE ON jobs_experience
+        FOR EACH ROW EXECUTE FUNCTION jobs_experience_months_worked_update()
+        """,
+        BACKFILL_SQL,
+    ],
+    'sqlite': [
+        f"""
+        CREATE TRIGGER jobs_experience_months_worked_insert AFTER INSERT ON jobs_experience
+        BEGIN
+            UPDATE jobs_experience SET months_worked = {MONTHS_WORKED.format(row='NEW')} WHERE id = NEW.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER jobs_experience_months_worked_update AFTER UPDATE ON jobs_experience
+        WHEN NEW.months_worked IS NOT {MONTHS_WORKED.format(row='NEW')}
+        BEGIN
+            UPDATE jobs_experience SET months_worked = {MONTHS_WORKED.format(row='NEW')} WHERE id = NEW.id;
+        END
+        """,
+        BACKFILL_SQL,
+    ],
+}
+
+DROP_SQL = {
+    'postgresql': [
+        'DROP TRIGGER IF EXISTS jobs_experience_months_worked_trigger ON jobs_experience',
+        'DROP FUNCTION IF EXISTS jobs_experience_months_worked_update()',
+    ],
+    'sqlite': [
+        'DROP TRIGGER IF EXISTS jobs_experience_months_worked_insert',
+        'DROP TRIGGER IF EXISTS jobs_experience_months_worked_update',
+    ],
+}
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_experience_months_worked'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_for_vendor(CREATE_SQL), run_for_vendor(DROP_SQL)),
+    ]
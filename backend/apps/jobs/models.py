@@ -1,9 +1,13 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
+from django.db.models import F, Q
 
 from apps.accounts.models import User
 from apps.jobs.validators import ExperienceValidator
 from common.models import Model
+from common.querysets import WITHOUT_DELETED
 
 
 class Experience(Model):
@@ -23,6 +27,25 @@ class Experience(Model):
     )
     is_still_in_role = models.BooleanField()
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='experiences')
+    search_vector = SearchVectorField(null=True, editable=False)
+    months_worked = models.IntegerField(null=True, editable=False)
 
     class Meta(Model.Meta):
-        pass
+        indexes = Model.Meta.indexes + [
+            models.Index(
+                fields=['user', '-created_at', '-id'],
+                name='jobs_experience_user_live_idx',
+                condition=WITHOUT_DELETED
+            ),
+            GinIndex(fields=['search_vector'], name='jobs_experience_search_idx'),
+            models.Index(
+                fields=['months_worked'],
+                name='jobs_experience_months_idx',
+                condition=WITHOUT_DELETED & Q(is_still_in_role=False)
+            ),
+            models.Index(
+                F('started_year') * 12 + F('started_month'),
+                name='jobs_experience_started_idx',
+                condition=WITHOUT_DELETED & Q(is_still_in_role=True)
+            ),
+        ]
@@ -1,10 +1,14 @@
+from datetime import datetime
 from typing import Dict, Any
 
+from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from apps.jobs.helpers import ExperienceHelper
 from apps.jobs.models import Experience
 from apps.jobs.validators import ExperienceValidator
+from common.serializers import CompiledModelSerializer
 
 
 class ExperienceWritableSerializer(serializers.ModelSerializer):
@@ -19,16 +23,28 @@ class ExperienceWritableSerializer(serializers.ModelSerializer):
         ]
 
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if self.instance is not None and self.partial:
+            current_data = {field: getattr(self.instance, field) for field in self.Meta.fields}
+            ExperienceValidator.validate_data({**current_data, **data})
+            return data
+
         return ExperienceValidator.validate_data(data)
 
 
-class ExperienceReadableSerializer(serializers.ModelSerializer):
+class ExperienceReadableSerializer(CompiledModelSerializer):
     working_period = serializers.SerializerMethodField()
+    varies_by_month = True
 
     class Meta:
         model = Experience
         fields = ['uuid', 'job_title', 'description', 'company_name', 'working_period']
+        compiled_sources = {
+            'working_period': ['started_month', 'started_year', 'ended_month', 'ended_year', 'is_still_in_role'],
+        }
+
+    @cached_property
+    def current_datetime(self) -> datetime:
+        return timezone.now()
 
-    @staticmethod
-    def get_working_period(experience: Experience) -> str:
-        return ExperienceHelper.get_working_period(experience)
+    def get_working_period(self, experience: Experience) -> str:
+        return ExperienceHelper.get_working_period(experience, self.current_datetime)
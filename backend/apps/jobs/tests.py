@@ -1,14 +1,32 @@
-from django.urls import reverse
+import csv
+import json
+from datetime import datetime
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import Resolver404, resolve, reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 
 from apps.accounts.models import User
+from apps.jobs.helpers import ExperienceHelper
 from apps.jobs.models import Experience
+from apps.jobs.serializers import ExperienceReadableSerializer
+from apps.jobs.views import ExperienceViewSet
+from common import caches
+from common.utils import generate_uuid
 
 
 class JobAPITestCase(APITestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.admin_user = User.objects.create_superuser(
             username='admin_user',
             email='admin@example.com',
@@ -73,6 +91,33 @@ class JobAPITestCase(APITestCase):
         self.assertEqual(data.get('started_year'), experience.started_year)
         self.assertEqual(data.get('ended_year'), experience.ended_year)
         self.assertEqual(data.get('is_still_in_role'), experience.is_still_in_role)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['Preference-Applied'], 'return=minimal')
+        self.assertEqual(
+            response['Location'],
+            f'http://testserver{reverse("experience-detail", kwargs={"uuid": experience.uuid})}'
+        )
+
+    def test_create_experience_with_representation_by_admin(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        data = {
+            'job_title': 'Software Developer',
+            'description': 'Backend services',
+            'company_name': 'Tech Solutions Co., Ltd.',
+            'started_month': 6,
+            'ended_month': None,
+            'started_year': 2019,
+            'ended_year': None,
+            'is_still_in_role': True
+        }
+
+        response = self.client.post(
+            reverse('experience-list'), data, format='json', HTTP_PREFER='handling=strict, return=representation'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response['Preference-Applied'], 'return=representation')
+        self.assertEqual(response.data, self.client.get(response['Location']).data)
+        self.assertEqual(response.data.get('job_title'), data.get('job_title'))
 
     def test_create_experience_with_invalid_year_by_admin(self) -> None:
         self.client.login(username='admin_user', password='admin_password')
@@ -209,6 +254,263 @@ class JobAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data.get('count'), 2)
 
+    def test_get_experiences_by_anonymous_skips_authentication(self) -> None:
+        urls = [
+            reverse('experience-list'),
+            reverse('experience-detail', kwargs={'uuid': self.experience1.uuid}),
+            reverse('async-experience-list'),
+            reverse('async-experience-detail', kwargs={'uuid': self.experience1.uuid}),
+        ]
+
+        for session_key in (None, 'expired-session'):
+            if session_key:
+                self.client.cookies[settings.SESSION_COOKIE_NAME] = session_key
+
+            for url in urls:
+                with CaptureQueriesContext(connection) as context:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotIn('Cookie', response.get('Vary', ''))
+                self.assertFalse([
+                    query['sql'] for query in context.captured_queries
+                    if 'django_session' in query['sql'] or 'accounts_user_profile' in query['sql']
+                ])
+
+    def test_get_all_experiences_with_cursor_pagination(self) -> None:
+        url = reverse('experience-list')
+        response = self.client.get(url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertIsNone(response.data.get('next'))
+        self.assertEqual(
+            [experience.get('uuid') for experience in response.data.get('results')],
+            [self.experience2.uuid, self.experience1.uuid]
+        )
+
+    def test_compiled_experience_serializer_matches_serializer(self) -> None:
+        Experience.objects.create(
+            job_title='Software Engineer',
+            description='Backend services',
+            company_name='Tech Solutions Co., Ltd.',
+            started_month=6,
+            started_year=2020,
+            is_still_in_role=True,
+            created_at=timezone.now(),
+            created_user=self.admin_user,
+            user=self.admin_user
+        )
+        queryset = Experience.objects.all()
+        plan = ExperienceReadableSerializer.get_plan()
+        self.assertIsNotNone(plan)
+        self.assertEqual(
+            plan.render(ExperienceReadableSerializer(), queryset.values(*plan.get_columns())),
+            ExperienceReadableSerializer(queryset, many=True).data
+        )
+
+    def test_get_experiences_with_sparse_fields(self) -> None:
+        with mock.patch.object(ExperienceHelper, 'get_working_period') as get_working_period:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse('experience-list'), {'fields': 'uuid,job_title'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data.get('results'),
+            [
+                {'uuid': self.experience2.uuid, 'job_title': self.experience2.job_title},
+                {'uuid': self.experience1.uuid, 'job_title': self.experience1.job_title},
+            ]
+        )
+        get_working_period.assert_not_called()
+        self.assertFalse(any('"description"' in query['sql'] for query in queries.captured_queries))
+
+    def test_get_an_experience_with_excluded_fields(self) -> None:
+        url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'exclude': 'description,working_period'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data), ['uuid', 'job_title', 'company_name'])
+        self.assertFalse(any('"description"' in query['sql'] for query in queries.captured_queries))
+        self.assertFalse(any('"ended_year"' in query['sql'] for query in queries.captured_queries))
+
+    def test_get_experiences_with_unknown_fields(self) -> None:
+        for name in ('experience-list', 'experience-export', 'async-experience-list'):
+            response = self.client.get(reverse(name), {'fields': 'uuid,nope,other', 'exclude': 'missing'})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(
+                response.data, {'fields': ['Unknown fields: nope, other.'], 'exclude': ['Unknown fields: missing.']}
+            )
+
+    def test_sparse_fields_apply_to_uncompiled_serializer_and_export(self) -> None:
+        request = Request(APIRequestFactory().get(reverse('experience-list'), {'fields': 'uuid'}))
+        serializer = ExperienceReadableSerializer(self.experience1, context={'request': request})
+        self.assertEqual(serializer.data, {'uuid': self.experience1.uuid})
+
+        response = self.client.get(reverse('experience-export'), {'export_format': 'csv', 'fields': 'uuid'})
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows, [{'uuid': self.experience2.uuid}, {'uuid': self.experience1.uuid}])
+
+        response = self.client.get(reverse('async-experience-list'), {'exclude': 'working_period'})
+        self.assertNotIn('working_period', response.data.get('results')[0])
+
+    def test_get_experiences_through_async_viewset(self) -> None:
+        for name, kwargs in (('list', {}), ('detail', {'uuid': self.experience1.uuid})):
+            response = self.client.get(reverse(f'async-experience-{name}', kwargs=kwargs))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data, self.client.get(reverse(f'experience-{name}', kwargs=kwargs)).data)
+
+        url = reverse('async-experience-detail', kwargs={'uuid': self.experience1.uuid})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        url = reverse('async-experience-detail', kwargs={'uuid': 'EXPERIENCE-missing'})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_get_all_experiences_through_async_client(self) -> None:
+        response = await self.async_client.get(reverse('async-experience-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 2)
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+    async def test_cached_async_list_uses_async_cache_calls(self) -> None:
+        with mock.patch.object(caches, 'get_response_key', side_effect=AssertionError), \
+                mock.patch.object(caches, 'count', side_effect=AssertionError):
+            for expected in ('MISS', 'HIT'):
+                response = await self.async_client.get(reverse('async-experience-list'))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response['X-Cache'], expected)
+
+    def test_async_urlconf_only_routes_async_viewsets(self) -> None:
+        match = resolve('/api/v1/async/experiences/', urlconf='config.urls_async')
+        self.assertEqual(match.url_name, 'async-experience-list')
+        with self.assertRaises(Resolver404):
+            resolve('/api/v1/experiences/', urlconf='config.urls_async')
+
+    def test_update_experience_through_async_viewset(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('async-experience-detail', kwargs={'uuid': self.experience1.uuid})
+
+        response = self.client.patch(url, {'job_title': 'Marketing Associate'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.experience1.refresh_from_db()
+        self.assertEqual('Marketing Associate', self.experience1.job_title)
+
+    def test_export_experiences_as_ndjson(self) -> None:
+        self.experience2.delete(user=self.admin_user)
+        Experience.objects.bulk_create([
+            Experience(
+                uuid=generate_uuid('Experience'),
+                job_title=f'Engineer {index}',
+                company_name='Tech Solutions Co., Ltd.',
+                started_month=1,
+                started_year=2020,
+                is_still_in_role=True,
+                created_at=timezone.now(),
+                created_user=self.admin_user,
+                user=self.admin_user
+            )
+            for index in range(4)
+        ])
+
+        with mock.patch.object(ExperienceViewSet, 'export_chunk_size', 2):
+            response = self.client.get(reverse('experience-export'))
+            lines = b''.join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertFalse(response.is_async)
+        expected = self.client.get(reverse('experience-list')).data['results']
+        self.assertEqual([json.loads(line) for line in lines], expected)
+        self.assertNotIn(self.experience2.uuid, ''.join(lines))
+
+    async def test_export_experiences_streams_incrementally_under_asgi(self) -> None:
+        await Experience.objects.abulk_create([
+            Experience(
+                uuid=generate_uuid('Experience'),
+                job_title=f'Engineer {index}',
+                company_name='Tech Solutions Co., Ltd.',
+                started_month=1,
+                started_year=2020,
+                is_still_in_role=True,
+                created_at=timezone.now(),
+                created_user=self.admin_user,
+                user=self.admin_user
+            )
+            for index in range(3)
+        ])
+        plan = ExperienceReadableSerializer.get_plan()
+
+        with mock.patch.object(ExperienceViewSet, 'export_chunk_size', 2), \
+                mock.patch.object(plan, 'arender', wraps=plan.arender) as arender:
+            response = await self.async_client.get(reverse('experience-export'))
+            self.assertTrue(response.is_async)
+
+            chunks = aiter(response.streaming_content)
+            first = await anext(chunks)
+            self.assertEqual(arender.call_count, 1)
+            self.assertEqual(len(first.splitlines()), 2)
+
+            lines = b''.join([first] + [chunk async for chunk in chunks]).decode().splitlines()
+            self.assertEqual(arender.call_count, 3)
+        self.assertEqual(len(lines), 5)
+
+    def test_export_experiences_as_csv(self) -> None:
+        response = self.client.get(reverse('experience-export'), {'export_format': 'csv'})
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual([row['uuid'] for row in rows], [self.experience2.uuid, self.experience1.uuid])
+        self.assertEqual(rows[1]['working_period'], 'Sep 2019 - Dec 2019 (4 months)')
+
+    def test_export_experiences_with_unknown_format(self) -> None:
+        response = self.client.get(reverse('experience-export'), {'export_format': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_experiences(self) -> None:
+        url = reverse('experience-list')
+
+        response = self.client.get(url, {'q': 'research university'})
+        self.assertEqual([item['uuid'] for item in response.data['results']], [self.experience2.uuid])
+
+        response = self.client.get(url, {'q': 'intern'})
+        self.assertEqual(response.data['count'], 2)
+
+        self.experience2.delete(user=self.admin_user)
+        response = self.client.get(url, {'q': 'research'})
+        self.assertEqual(response.data['count'], 0)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Full-text search requires PostgreSQL')
+    def test_search_experiences_is_ranked(self) -> None:
+        Experience.objects.filter(pk=self.experience2.pk).update(description='Marketing research for marketing teams')
+
+        response = self.client.get(reverse('experience-list'), {'q': 'marketing'})
+        self.assertEqual(
+            [item['uuid'] for item in response.data['results']],
+            [self.experience1.uuid, self.experience2.uuid]
+        )
+
+        Experience.objects.bulk_create([
+            Experience(
+                uuid=generate_uuid('Experience'),
+                job_title='Software Engineer',
+                company_name='Tech Solutions Co., Ltd.',
+                started_month=1,
+                started_year=2020,
+                is_still_in_role=True,
+                created_at=timezone.now(),
+                created_user=self.admin_user,
+                user=self.admin_user
+            )
+            for _ in range(1000)
+        ])
+        with connection.cursor() as cursor:
+            # Vacuum would normally flush rows from the GIN pending list, which the planner prices as a full scan
+            cursor.execute("SELECT gin_clean_pending_list('jobs_experience_search_idx')")
+            cursor.execute('ANALYZE')
+        self.assertIn('jobs_experience_search_idx', Experience.objects.filter(
+            search_vector=SearchQuery('marketing', config='english')
+        ).explain())
+
     def test_get_an_experience_by_admin(self) -> None:
         self.client.login(username='admin_user', password='admin_password')
         url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
@@ -221,6 +523,19 @@ class JobAPITestCase(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_get_an_experience_with_malformed_uuid(self) -> None:
+        for uuid in ('EXPERIENCE-missing', self.experience1.uuid.replace('EXPERIENCE', 'USER-PROFILE')):
+            response = self.client.get(reverse('experience-detail', kwargs={'uuid': uuid}))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_experience_uuid_is_stored_natively(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT uuid FROM jobs_experience WHERE id = %s', [self.experience1.id])
+            stored = cursor.fetchone()[0]
+
+        self.assertTrue(self.experience1.uuid.startswith('EXPERIENCE-'))
+        self.assertEqual(str(stored).replace('-', ''), self.experience1.uuid[len('EXPERIENCE-'):].replace('-', ''))
+
     def test_get_an_experience_by_anonymous(self) -> None:
         url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
         response = self.client.get(url)
@@ -254,6 +569,120 @@ class JobAPITestCase(APITestCase):
         self.assertEqual(data.get('ended_year'), experience.ended_year)
         self.assertEqual(data.get('is_still_in_role'), experience.is_still_in_role)
 
+    def test_bulk_create_experiences_by_admin(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('experience-list')
+
+        data = [
+            {
+                'job_title': 'Data Engineer',
+                'description': '',
+                'company_name': 'DataWorks Co., Ltd.',
+                'started_month': 1,
+                'ended_month': 6,
+                'started_year': 2021,
+                'ended_year': 2022,
+                'is_still_in_role': False
+            },
+            {
+                'job_title': 'Platform Engineer',
+                'description': '',
+                'company_name': 'Cloud Nine Ltd.',
+                'started_month': 7,
+                'ended_month': None,
+                'started_year': 2022,
+                'ended_year': None,
+                'is_still_in_role': True
+            },
+        ]
+
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response['Preference-Applied'], 'return=minimal')
+        self.assertEqual(len(response.data), 2)
+
+        experience = Experience.objects.get(uuid=response.data[1].get('uuid'))
+        self.assertEqual(data[1].get('job_title'), experience.job_title)
+        self.assertEqual(self.admin_user, experience.user)
+        self.assertEqual(self.admin_user, experience.created_user)
+        self.assertIsNotNone(experience.created_at)
+
+        response = self.client.post(url, data, format='json', HTTP_PREFER='return=representation')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response['Preference-Applied'], 'return=representation')
+        self.assertEqual([item.get('job_title') for item in response.data], [item.get('job_title') for item in data])
+        for item in response.data:
+            detail = self.client.get(reverse('experience-detail', kwargs={'uuid': item.get('uuid')}))
+            self.assertEqual(item, detail.data)
+
+    def test_bulk_create_experiences_reports_errors_per_index(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('experience-list')
+
+        data = [
+            {
+                'job_title': 'Data Engineer',
+                'description': '',
+                'company_name': 'DataWorks Co., Ltd.',
+                'started_month': 1,
+                'ended_month': 6,
+                'started_year': 2021,
+                'ended_year': 2022,
+                'is_still_in_role': False
+            },
+            {
+                'job_title': 'Platform Engineer',
+                'description': '',
+                'company_name': 'Cloud Nine Ltd.',
+                'started_month': 7,
+                'ended_month': None,
+                'started_year': 2022,
+                'ended_year': None,
+                'is_still_in_role': False
+            },
+        ]
+
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertTrue(response.data[1])
+        self.assertEqual(Experience.objects.count(), 2)
+
+    def test_bulk_partial_update_experiences_by_admin(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('experience-bulk-partial-update')
+
+        data = [
+            {'uuid': self.experience1.uuid, 'job_title': 'Marketing Associate'},
+            {'uuid': self.experience2.uuid, 'company_name': 'Institute of Science and Tech'},
+        ]
+
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.experience1.refresh_from_db()
+        self.experience2.refresh_from_db()
+        self.assertEqual(data[0].get('job_title'), self.experience1.job_title)
+        self.assertEqual(data[1].get('company_name'), self.experience2.company_name)
+        self.assertEqual(self.admin_user, self.experience1.updated_user)
+
+    def test_bulk_partial_update_experiences_reports_errors_per_index(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        url = reverse('experience-bulk-partial-update')
+
+        data = [
+            {'uuid': self.experience1.uuid, 'job_title': 'Marketing Associate'},
+            {'uuid': 'EXPERIENCE-missing', 'job_title': 'Researcher'},
+        ]
+
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('uuid', response.data[1])
+
+        self.experience1.refresh_from_db()
+        self.assertEqual('Marketing Intern', self.experience1.job_title)
+
     def test_update_experience_by_non_admin(self) -> None:
         self.client.login(username='regular_user', password='regular_password')
         url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
@@ -295,6 +724,147 @@ class JobAPITestCase(APITestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
+    def test_get_all_experiences_is_cached(self) -> None:
+        url = reverse('experience-list')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response.data.get('count'), 2)
+        self.assertEqual(caches.get_stats(Experience), {caches.HITS: 1, caches.MISSES: 1})
+
+    def test_delete_experience_invalidates_cache(self) -> None:
+        url = reverse('experience-list')
+        self.client.get(url)
+
+        self.client.login(username='admin_user', password='admin_password')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('experience-detail', kwargs={'uuid': self.experience1.uuid}))
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data.get('count'), 1)
+
+    def test_queryset_writes_invalidate_cache_after_the_update(self) -> None:
+        queryset = Experience.objects_with_deleted.filter(pk=self.experience1.pk)
+        states = []
+
+        with mock.patch.object(caches, 'invalidate', side_effect=lambda model: states.append(
+                Experience.objects.filter(pk=self.experience1.pk).exists()
+        )):
+            queryset.delete(user=self.admin_user)
+            queryset.restore()
+            queryset.delete(hard=True)
+
+        self.assertEqual(states, [False, True, False])
+
+    def test_hard_delete_experience_invalidates_cache(self) -> None:
+        url = reverse('experience-list')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.experience1.delete(hard=True)
+
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data.get('count'), 1)
+
+    def test_get_all_experiences_not_modified(self) -> None:
+        url = reverse('experience-list')
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertNotIn('Last-Modified', response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.experience1.delete(user=self.admin_user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_get_all_experiences_validators_follow_deletes(self) -> None:
+        url = reverse('experience-list')
+        with self.settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+            etag = self.client.get(url, {'pagination': 'cursor'})['ETag']
+
+            Experience.objects.filter(pk=self.experience1.pk).update(
+                deleted_at=timezone.now(), deleted_user=self.admin_user
+            )
+            response = self.client.get(url, {'pagination': 'cursor'}, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response['ETag'], etag)
+
+    def test_working_period_validators_change_with_month(self) -> None:
+        Experience.objects.filter(pk=self.experience2.pk).update(
+            is_still_in_role=True, ended_month=None, ended_year=None, months_worked=None
+        )
+        url = reverse('experience-detail', kwargs={'uuid': self.experience2.uuid})
+        current_datetime = timezone.now()
+        response = self.client.get(url)
+
+        with mock.patch('django.utils.timezone.now', return_value=current_datetime + timezone.timedelta(days=31)):
+            for headers in ({'HTTP_IF_NONE_MATCH': response['ETag']},
+                            {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']}):
+                next_response = self.client.get(url, **headers)
+                self.assertEqual(next_response.status_code, status.HTTP_200_OK)
+                self.assertNotEqual(next_response['ETag'], response['ETag'])
+                self.assertNotEqual(next_response.data['working_period'], response.data['working_period'])
+
+    def test_get_an_experience_not_modified_since(self) -> None:
+        url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
+        last_modified = self.client.get(url)['Last-Modified']
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_restore_experience_by_admin(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        self.experience1.delete(user=self.admin_user)
+        url = reverse('experience-restore', kwargs={'uuid': self.experience1.uuid})
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.experience1.refresh_from_db()
+        self.assertIsNone(self.experience1.deleted_at)
+        self.assertEqual(self.admin_user, self.experience1.updated_user)
+
+    def test_bulk_delete_and_restore_experiences_by_admin(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        data = {'uuids': [self.experience1.uuid, self.experience2.uuid]}
+
+        with self.assertNumQueries(3):
+            response = self.client.post(reverse('experience-bulk-destroy'), data, format='json')
+        self.assertEqual(response.data, {'count': 2})
+        self.assertEqual(Experience.objects.count(), 0)
+
+        response = self.client.post(reverse('experience-bulk-restore'), data, format='json')
+        self.assertEqual(response.data, {'count': 2})
+        self.assertEqual(Experience.objects.count(), 2)
+
+    def test_bulk_delete_experiences_requires_uuids_or_filter(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        response = self.client.post(reverse('experience-bulk-destroy'), {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Experience.objects.count(), 2)
+
+    def test_bulk_delete_experiences_ignores_malformed_uuids(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        foreign_uuid = self.experience2.uuid.replace('EXPERIENCE', 'USER')
+        data = {'uuids': [self.experience1.uuid, 'EXPERIENCE-missing', foreign_uuid]}
+
+        response = self.client.post(reverse('experience-bulk-destroy'), data, format='json')
+        self.assertEqual(response.data, {'count': 1})
+        self.assertEqual(Experience.objects.count(), 1)
+
+    def test_bulk_delete_experiences_by_anonymous(self) -> None:
+        data = {'uuids': [self.experience1.uuid]}
+        response = self.client.post(reverse('experience-bulk-destroy'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_delete_experience_by_non_admin(self) -> None:
         self.client.login(username='regular_user', password='regular_password')
         url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
@@ -305,3 +875,198 @@ class JobAPITestCase(APITestCase):
         url = reverse('experience-detail', kwargs={'uuid': self.experience1.uuid})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ExperienceTenureTestCase(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.admin_user = User.objects.create_superuser(
+            username='admin_user',
+            email='admin@example.com',
+            password='admin_password'
+        )
+        self.current_datetime = timezone.make_aware(datetime(2024, 5, 18))
+        periods = [
+            (9, 2019, 12, 2019), (1, 2020, 12, 2020), (1, 2020, 1, 2021), (3, 2010, 2, 2012),
+            (6, 2019, None, None), (5, 2024, None, None), (6, 2022, None, None), (12, 2021, None, None),
+        ]
+        self.experiences = [
+            Experience.objects.create(
+                job_title=f'Engineer {index}',
+                company_name='Tech Solutions Co., Ltd.',
+                started_month=started_month,
+                started_year=started_year,
+                ended_month=ended_month,
+                ended_year=ended_year,
+                is_still_in_role=ended_month is None,
+                created_at=timezone.now(),
+                created_user=self.admin_user,
+                user=self.admin_user
+            )
+            for index, (started_month, started_year, ended_month, ended_year) in enumerate(periods)
+        ]
+
+    def get_months_worked(self, experience: Experience) -> int:
+        return ExperienceHelper.calculate_total_months_worked(experience, self.current_datetime)
+
+    def get_uuids(self, params: dict) -> list:
+        with mock.patch('apps.jobs.filters.timezone.now', return_value=self.current_datetime):
+            response = self.client.get(reverse('experience-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['uuid'] for item in response.data['results']]
+
+    def test_months_worked_is_stored_for_ended_roles(self) -> None:
+        for experience in self.experiences:
+            experience.refresh_from_db()
+            expected = None if experience.is_still_in_role else self.get_months_worked(experience)
+            self.assertEqual(experience.months_worked, expected)
+
+    def test_filter_by_months_matches_helper(self) -> None:
+        for months in [0, 1, 4, 12, 13, 23, 24, 25, 59, 60, 61, 100]:
+            self.assertCountEqual(self.get_uuids({'min_months': months}), [
+                experience.uuid for experience in self.experiences if self.get_months_worked(experience) >= months
+            ])
+            self.assertCountEqual(self.get_uuids({'max_months': months}), [
+                experience.uuid for experience in self.experiences if self.get_months_worked(experience) <= months
+            ])
+
+    def test_filter_by_months_range(self) -> None:
+        self.assertCountEqual(self.get_uuids({'min_months': 12, 'max_months': 24}), [
+            experience.uuid for experience in self.experiences if 12 <= self.get_months_worked(experience) <= 24
+        ])
+
+    def test_filter_by_invalid_months(self) -> None:
+        response = self.client.get(reverse('experience-list'), {'min_months': 'two years'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_order_by_duration_matches_helper(self) -> None:
+        experiences = sorted(reversed(self.experiences), key=self.get_months_worked)
+        self.assertEqual(self.get_uuids({'ordering': 'duration'}), [experience.uuid for experience in experiences])
+
+        experiences = sorted(reversed(self.experiences), key=self.get_months_worked, reverse=True)
+        self.assertEqual(self.get_uuids({'ordering': '-duration'}), [experience.uuid for experience in experiences])
+
+    def test_order_by_duration_rejects_search_and_cursor(self) -> None:
+        for params in ({'q': 'engineer'}, {'pagination': 'cursor'}):
+            response = self.client.get(reverse('experience-list'), {'ordering': 'duration', **params})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('ordering', response.data)
+
+    def test_search_rejects_cursor(self) -> None:
+        response = self.client.get(reverse('experience-list'), {'q': 'engineer', 'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('q', response.data)
+
+    def test_export_keeps_filter_ordering(self) -> None:
+        with mock.patch('apps.jobs.filters.timezone.now', return_value=self.current_datetime):
+            response = self.client.get(reverse('experience-export'), {'export_format': 'csv', 'ordering': 'duration'})
+            rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual([row['uuid'] for row in rows], self.get_uuids({'ordering': 'duration'}))
+
+    def test_queryset_writes_maintain_months_worked(self) -> None:
+        experience = self.experiences[0]
+        Experience.objects.filter(pk=experience.pk).update(ended_month=6, ended_year=2020, months_worked=0)
+        experience.refresh_from_db()
+        self.assertEqual(experience.months_worked, 10)
+
+        experience.is_still_in_role = True
+        Experience.objects.bulk_update([experience], fields=['is_still_in_role'])
+        experience.refresh_from_db()
+        self.assertIsNone(experience.months_worked)
+
+    def test_update_recalculates_months_worked(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        experience = self.experiences[4]
+
+        url = reverse('experience-detail', kwargs={'uuid': experience.uuid})
+        response = self.client.patch(url, {'is_still_in_role': False, 'ended_month': 5, 'ended_year': 2020})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        experience.refresh_from_db()
+        self.assertEqual(experience.months_worked, 12)
+
+    def test_bulk_writes_maintain_months_worked(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        data = [{
+            'job_title': 'Data Engineer',
+            'description': '',
+            'company_name': 'DataWorks Co., Ltd.',
+            'started_month': 1,
+            'ended_month': 6,
+            'started_year': 2021,
+            'ended_year': 2022,
+            'is_still_in_role': False
+        }]
+
+        response = self.client.post(reverse('experience-list'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        experience = Experience.objects.get(uuid=response.data[0]['uuid'])
+        self.assertEqual(experience.months_worked, 18)
+
+        data = [{'uuid': experience.uuid, 'ended_month': 12}]
+        response = self.client.patch(reverse('experience-bulk-partial-update'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        experience.refresh_from_db()
+        self.assertEqual(experience.months_worked, 24)
+
+
+class ExperienceIndexTestCase(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='regular_user', password='regular_password')
+        users = [self.user] + User.objects.bulk_create([
+            User(uuid=generate_uuid('UserProfile'), username=f'user_{index}') for index in range(19)
+        ])
+        Experience.objects.bulk_create([
+            Experience(
+                uuid=generate_uuid('Experience'),
+                job_title='Software Engineer',
+                company_name='Tech Solutions Co., Ltd.',
+                started_month=1,
+                started_year=2020,
+                is_still_in_role=True,
+                created_at=timezone.now(),
+                created_user=self.user,
+                user=users[index % len(users)]
+            )
+            for index in range(1000)
+        ])
+        # deleted_at and deleted_user are estimated independently, so the trash needs to be large for its index to win
+        Experience.objects.filter(id__in=Experience.objects.values('id')[:500]).delete(user=self.user)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_list_uses_live_index(self) -> None:
+        self.assertIn('jobs_experience_live_idx', Experience.objects.all()[:30].explain())
+
+    def test_trash_uses_trash_index(self) -> None:
+        self.assertIn('jobs_experience_trash_idx', Experience.objects_deleted.all()[:30].explain())
+
+    def test_user_list_uses_user_live_index(self) -> None:
+        queryset = Experience.objects.filter(user=self.user)[:30]
+        self.assertIn('jobs_experience_user_live_idx', queryset.explain())
+
+
+class ExperienceHelperTestCase(TestCase):
+    def test_get_working_periods(self) -> None:
+        experiences = [
+            Experience(started_month=9, started_year=2019, ended_month=12, ended_year=2019, is_still_in_role=False),
+            Experience(started_month=1, started_year=2020, ended_month=12, ended_year=2020, is_still_in_role=False),
+            Experience(started_month=1, started_year=2020, ended_month=1, ended_year=2021, is_still_in_role=False),
+            Experience(started_month=6, started_year=2019, is_still_in_role=True),
+            Experience(started_month=5, started_year=2024, is_still_in_role=True),
+        ]
+        current_datetime = datetime(2024, 5, 18)
+
+        self.assertEqual(ExperienceHelper.get_working_periods(experiences, current_datetime), [
+            'Sep 2019 - Dec 2019 (4 months)',
+            'Jan 2020 - Dec 2020 (1 year)',
+            'Jan 2020 - Jan 2021 (1 year 1 month)',
+            'Jun 2019 - Present (5 years)',
+            'May 2024 - Present (1 month)',
+        ])
+        self.assertEqual(
+            ExperienceHelper.get_working_periods(experiences, current_datetime),
+            [ExperienceHelper.get_working_period(experience, current_datetime) for experience in experiences]
+        )
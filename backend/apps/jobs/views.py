@@ -1,16 +1,25 @@
-from django.utils import timezone
-
+from apps.jobs.filters import ExperienceFilterSet
 from apps.jobs.models import Experience
 from apps.jobs.serializers import ExperienceWritableSerializer, ExperienceReadableSerializer
+from common.mixins import BulkModelMixin, ExportModelMixin
 from common.permissions import IsAdminUserOrReadOnly
-from common.viewsets import ModelViewSet
+from common.viewsets import AsyncModelViewSet, ModelViewSet
 
 
-class ExperienceViewSet(ModelViewSet):
+class ExperienceViewSet(BulkModelMixin, ExportModelMixin, ModelViewSet):
     queryset = Experience.objects.all()
     writable_serializer = ExperienceWritableSerializer
     readable_serializer = ExperienceReadableSerializer
     permission_classes = [IsAdminUserOrReadOnly]
+    ordering = ['-created_at', '-id']
+    filterset_class = ExperienceFilterSet
+    search_fields = ['job_title', 'company_name', 'description']
+    search_vector_field = 'search_vector'
+    cache_timeout = 60
+
+    def get_create_kwargs(self):
+        return {**super().get_create_kwargs(), 'user': self.request.user}
+
 
-    def perform_create(self, serializer):
-        serializer.save(created_at=timezone.now(), created_user=self.request.user, user=self.request.user)
+class AsyncExperienceViewSet(AsyncModelViewSet, ExperienceViewSet):
+    pass
@@ -0,0 +1,171 @@
+import platform
+import statistics
+import time
+import tracemalloc
+from itertools import count
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.jobs.models import Experience
+from common.utils import generate_uuid
+
+ADMIN_USERNAME = 'benchmark_admin'
+
+BUDGETS = {
+    'experience-list': 6,
+    'experience-retrieve': 4,
+    'experience-create': 3,
+    'experience-update': 4,
+    'experience-partial_update': 4,
+    'experience-destroy': 4,
+    'experience-export': 3,
+    'async-experience-list': 6,
+    'async-experience-retrieve': 4,
+    'user-list': 7,
+    'user-retrieve': 6,
+    'user-create': 4,
+    'user-update': 5,
+    'user-partial_update': 4,
+    'user-destroy': 8,
+    'user-me': 4,
+    'async-user-me': 4,
+}
+
+
+def seed(users, experiences):
+    admin = User.objects.create_superuser(username=ADMIN_USERNAME, password=ADMIN_USERNAME)
+    password = make_password(None)
+    profiles = User.objects.bulk_create([
+        User(uuid=generate_uuid('UserProfile'), username=f'benchmark_user_{index}', password=password)
+        for index in range(users)
+    ])
+    owners = profiles or [admin]
+    now = timezone.now()
+    Experience.objects.bulk_create([
+        Experience(
+            uuid=generate_uuid('Experience'),
+            job_title=f'Engineer {index}',
+            company_name='Benchmark Co., Ltd.',
+            started_month=index % 12 + 1,
+            started_year=2000 + index % 25,
+            is_still_in_role=True,
+            created_at=now,
+            created_user=admin,
+            user=owners[index % len(owners)]
+        )
+        for index in range(experiences)
+    ])
+    return admin
+
+
+def get_scenarios():
+    sequence = count()
+    experience = {
+        'job_title': 'Benchmark Engineer',
+        'description': '',
+        'company_name': 'Benchmark Co., Ltd.',
+        'started_month': 1,
+        'started_year': 2020,
+        'ended_month': None,
+        'ended_year': None,
+        'is_still_in_role': True,
+    }
+    experience_uuids = iter(Experience.objects.order_by('id').values_list('uuid', flat=True))
+    user_uuids = iter(
+        User.objects.filter(username__startswith='benchmark_user_').order_by('id').values_list('uuid', flat=True)
+    )
+
+    def experience_detail(prefix=''):
+        uuid = Experience.objects.values_list('uuid', flat=True)[0]
+        return reverse(f'{prefix}experience-detail', kwargs={'uuid': uuid})
+
+    def user_detail():
+        return reverse('user-detail', kwargs={'uuid': User.objects.values_list('uuid', flat=True)[0]})
+
+    return [
+        ('experience-list', 'get', lambda: (reverse('experience-list'), {'_': next(sequence)})),
+        ('experience-retrieve', 'get', lambda: (experience_detail(), {'_': next(sequence)})),
+        ('experience-create', 'post', lambda: (reverse('experience-list'), experience)),
+        ('experience-update', 'put', lambda: (experience_detail(), experience)),
+        ('experience-partial_update', 'patch', lambda: (experience_detail(), {'job_title': 'Benchmark Lead'})),
+        ('experience-destroy', 'delete', lambda: (
+            reverse('experience-detail', kwargs={'uuid': next(experience_uuids)}), None
+        )),
+        ('experience-export', 'get', lambda: (reverse('experience-export'), {'_': next(sequence)})),
+        ('async-experience-list', 'get', lambda: (reverse('async-experience-list'), {'_': next(sequence)})),
+        ('async-experience-retrieve', 'get', lambda: (experience_detail('async-'), {'_': next(sequence)})),
+        ('user-list', 'get', lambda: (reverse('user-list'), {'_': next(sequence)})),
+        ('user-retrieve', 'get', lambda: (user_detail(), {'_': next(sequence)})),
+        ('user-create', 'post', lambda: (reverse('user-list'), {
+            'username': f'benchmark_created_{time.time_ns()}', 'password': 'benchmark_password'
+        })),
+        ('user-update', 'put', lambda: (user_detail(), {'username': f'benchmark_updated_{time.time_ns()}'})),
+        ('user-partial_update', 'patch', lambda: (user_detail(), {'first_name': 'Benchmark'})),
+        ('user-destroy', 'delete', lambda: (reverse('user-detail', kwargs={'uuid': next(user_uuids)}), None)),
+        ('user-me', 'get', lambda: (reverse('user-me'), {'_': next(sequence)})),
+        ('async-user-me', 'get', lambda: (reverse('async-user-me'), {'_': next(sequence)})),
+    ]
+
+
+def measure(client, method, build, trace=False):
+    url, data = build()
+    if trace:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        response = getattr(client, method)(url, data, format=None if method == 'get' else 'json')
+        if response.streaming:
+            b''.join(response.streaming_content)
+    elapsed = time.perf_counter() - started
+
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return response.status_code, elapsed, len(queries), peak
+
+
+def run(admin, repeat=5):
+    client = APIClient()
+    client.force_login(admin)
+    results = {}
+
+    for name, method, build in get_scenarios():
+        samples = [measure(client, method, build) for _ in range(repeat)]
+        samples.append(measure(client, method, build, trace=True))
+        latencies = sorted(sample[1] for sample in samples[:-1])
+        results[name] = {
+            'statuses': sorted({sample[0] for sample in samples}),
+            'queries': max(sample[2] for sample in samples),
+            'budget': BUDGETS.get(name),
+            'p50_ms': round(statistics.median(latencies) * 1000, 3),
+            'max_ms': round(latencies[-1] * 1000, 3),
+            'peak_kib': round(samples[-1][3] / 1024, 1),
+        }
+
+    return results
+
+
+def get_violations(results):
+    return {
+        name: result for name, result in results.items()
+        if (result['budget'] is not None and result['queries'] > result['budget'])
+        or any(status >= 400 for status in result['statuses'])
+    }
+
+
+def get_environment(**kwargs):
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        **kwargs,
+    }
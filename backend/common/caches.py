@@ -0,0 +1,81 @@
+import hashlib
+import time
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+GENERATION_KEY = 'generation:{label}'
+RESPONSE_KEY = 'response:{label}:{generation}:{digest}'
+COUNTER_KEY = 'response:{label}:{counter}'
+HITS = 'hits'
+MISSES = 'misses'
+
+
+def get_generation(model) -> int:
+    key = GENERATION_KEY.format(label=model._meta.label_lower)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), None)
+        generation = cache.get(key)
+    return generation
+
+
+async def aget_generation(model) -> int:
+    key = GENERATION_KEY.format(label=model._meta.label_lower)
+    generation = await cache.aget(key)
+    if generation is None:
+        await cache.aadd(key, time.time_ns(), None)
+        generation = await cache.aget(key)
+    return generation
+
+
+def bump_generation(model) -> None:
+    key = GENERATION_KEY.format(label=model._meta.label_lower)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def invalidate(model) -> None:
+    transaction.on_commit(lambda: bump_generation(model))
+
+
+def get_response_key(model, path: str, auth: str) -> str:
+    digest = hashlib.md5(f'{auth}:{path}'.encode()).hexdigest()
+    return RESPONSE_KEY.format(label=model._meta.label_lower, generation=get_generation(model), digest=digest)
+
+
+async def aget_response_key(model, path: str, auth: str) -> str:
+    digest = hashlib.md5(f'{auth}:{path}'.encode()).hexdigest()
+    return RESPONSE_KEY.format(label=model._meta.label_lower, generation=await aget_generation(model), digest=digest)
+
+
+def count(model, counter: str) -> None:
+    key = COUNTER_KEY.format(label=model._meta.label_lower, counter=counter)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+async def acount(model, counter: str) -> None:
+    key = COUNTER_KEY.format(label=model._meta.label_lower, counter=counter)
+    await cache.aadd(key, 0, None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, 1, None)
+
+
+def get_stats(model) -> dict:
+    keys = {counter: COUNTER_KEY.format(label=model._meta.label_lower, counter=counter) for counter in (HITS, MISSES)}
+    values = cache.get_many(keys.values())
+    return {counter: values.get(key, 0) for counter, key in keys.items()}
+
+
+def is_shared(alias: str) -> bool:
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.checks import Error, Tags, register
+from django.urls import URLResolver, get_resolver
+
+from common import caches
+
+
+def get_view_classes(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from get_view_classes(pattern.url_patterns)
+            continue
+
+        view_class = getattr(pattern.callback, 'cls', None)
+        if view_class is not None:
+            yield view_class
+
+
+@register(Tags.caches, deploy=True)
+def check_response_cache(app_configs, **kwargs):
+    cached = sorted({
+        view_class.__name__ for view_class in get_view_classes(get_resolver().url_patterns)
+        if getattr(view_class, 'cache_timeout', None) is not None
+    })
+    if not cached or caches.is_shared(DEFAULT_CACHE_ALIAS):
+        return []
+
+    return [Error(
+        f'Cached responses ({", ".join(cached)}) need a cache shared by every worker.',
+        hint='Point CACHE_URL at Redis or Memcached; generation bumps in a process-local cache reach one worker only.',
+        id='common.E001',
+    )]
+
+
+@register(Tags.caches, deploy=True)
+def check_concurrency_limits(app_configs, **kwargs):
+    if not settings.CONCURRENCY_LIMITS or caches.is_shared(DEFAULT_CACHE_ALIAS):
+        return []
+
+    return [Error(
+        'Concurrency limits need a cache shared by every worker.',
+        hint='Point CACHE_URL at Redis or Memcached; in-flight counts in a process-local cache cover one worker only.',
+        id='common.E002',
+    )]
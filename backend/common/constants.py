@@ -1,8 +1,14 @@
 CREATE = 'create'
 UPDATE = 'update'
 PARTIAL_UPDATE = 'partial_update'
-WRITABLE_ACTIONS = [CREATE, UPDATE, PARTIAL_UPDATE]
+BULK_PARTIAL_UPDATE = 'bulk_partial_update'
+WRITABLE_ACTIONS = [CREATE, UPDATE, PARTIAL_UPDATE, BULK_PARTIAL_UPDATE]
 
 LIST = 'list'
 RETRIEVE = 'retrieve'
 READABLE_ACTIONS = [LIST, RETRIEVE]
+
+EXPORT = 'export'
+
+RETURN_MINIMAL = 'return=minimal'
+RETURN_REPRESENTATION = 'return=representation'
@@ -0,0 +1,163 @@
+import json
+import os
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from common import caches
+from common.signals import rows_loaded
+
+MODELS = ['accounts.UserProfile', 'jobs.Experience']
+MANIFEST = 'manifest.json'
+
+
+class CopyError(Exception):
+    pass
+
+
+def check_vendor():
+    if connection.vendor != 'postgresql':
+        raise CopyError(f'COPY requires PostgreSQL, not {connection.vendor}.')
+
+
+def get_models(labels=None):
+    models = []
+    for label in labels or MODELS:
+        model = apps.get_model(label)
+        models.append(model)
+        # Auto-created many-to-many tables (user groups and permissions) have no model of their own to list
+        models.extend(
+            field.remote_field.through for field in model._meta.local_many_to_many
+            if field.remote_field.through._meta.auto_created
+        )
+    return models
+
+
+def get_columns(model):
+    return [field.column for field in model._meta.concrete_fields]
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST)) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {'models': {}, 'imported': []}
+
+
+def write_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST)
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(f'{path}.tmp', path)
+
+
+def get_chunk_bound(model, last_id, batch_size):
+    bounds = model._base_manager.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)
+    return bounds[batch_size - 1:batch_size].first() or bounds.last()
+
+
+def export(directory, labels=None, batch_size=50000, log=None):
+    check_vendor()
+    os.makedirs(directory, exist_ok=True)
+    manifest = read_manifest(directory)
+
+    for model in get_models(labels):
+        label = model._meta.label_lower
+        entry = manifest['models'].setdefault(label, {'columns': get_columns(model), 'chunks': []})
+        if entry['columns'] != get_columns(model):
+            raise CopyError(f'{label} columns changed since this export started.')
+
+        last_id = entry['chunks'][-1]['last_id'] if entry['chunks'] else 0
+        while True:
+            upper = get_chunk_bound(model, last_id, batch_size)
+            if upper is None:
+                break
+
+            name = f'{label}-{len(entry["chunks"]) + 1:06d}.csv'
+            rows = export_chunk(model, os.path.join(directory, name), last_id, upper)
+            entry['chunks'].append({'file': name, 'first_id': last_id + 1, 'last_id': upper, 'rows': rows})
+            write_manifest(directory, manifest)
+            last_id = upper
+            if log:
+                log(f'{name}: {rows} rows')
+
+    return manifest
+
+
+def export_chunk(model, path, last_id, upper):
+    queryset = model._base_manager.filter(pk__gt=last_id, pk__lte=upper).order_by('pk')
+    queryset = queryset.values_list(*[field.attname for field in model._meta.concrete_fields])
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor, open(f'{path}.tmp', 'w', newline='') as file:
+        cursor.copy_expert(cursor.mogrify(f'COPY ({sql}) TO STDOUT WITH (FORMAT csv)', params), file)
+        rows = cursor.rowcount
+
+    os.replace(f'{path}.tmp', path)
+    return rows
+
+
+def load(directory, labels=None, log=None):
+    check_vendor()
+    manifest = read_manifest(directory)
+    if not manifest['models']:
+        raise CopyError(f'No export manifest found in {directory}.')
+
+    for model in get_models(labels):
+        label = model._meta.label_lower
+        entry = manifest['models'].get(label)
+        if entry is None:
+            continue
+        if entry['columns'] != get_columns(model):
+            raise CopyError(f'{label} columns in the export do not match the current schema.')
+
+        for chunk in entry['chunks']:
+            if chunk['file'] in manifest['imported']:
+                continue
+
+            pks = load_chunk(model, os.path.join(directory, chunk['file']), entry['columns'])
+            manifest['imported'].append(chunk['file'])
+            write_manifest(directory, manifest)
+            rows_loaded.send(sender=model, pks=pks)
+            if log:
+                log(f'{chunk["file"]}: {len(pks)} of {chunk["rows"]} rows inserted, '
+                    f'{chunk["rows"] - len(pks)} already present')
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [model]):
+                cursor.execute(sql)
+        caches.invalidate(model)
+
+    return manifest
+
+
+def load_chunk(model, path, columns):
+    table = connection.ops.quote_name(model._meta.db_table)
+    staging = connection.ops.quote_name(f'{model._meta.db_table}_copy')
+    pk = connection.ops.quote_name(model._meta.pk.column)
+    column_list = ', '.join(connection.ops.quote_name(column) for column in columns)
+    staged = ', '.join(f'staged.{connection.ops.quote_name(column)}' for column in columns)
+    existing = ', '.join(f'existing.{connection.ops.quote_name(column)}' for column in columns)
+
+    with transaction.atomic(), connection.cursor() as cursor, open(path, newline='') as file:
+        cursor.execute(f'CREATE TEMPORARY TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP')
+        cursor.copy_expert(f'COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv)', file)
+        cursor.execute(
+            f'INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} '
+            f'ON CONFLICT DO NOTHING RETURNING {pk}'
+        )
+        pks = [row[0] for row in cursor.fetchall()]
+
+        # Rows identical to what is already there are a resumed chunk, anything else would be lost silently
+        cursor.execute(
+            f'SELECT count(*) FROM {staging} AS staged LEFT JOIN {table} AS existing ON existing.{pk} = staged.{pk} '
+            f'WHERE existing.{pk} IS NULL OR ROW({staged}) IS DISTINCT FROM ROW({existing})'
+        )
+        conflicts = cursor.fetchone()[0]
+        if conflicts:
+            raise CopyError(f'{os.path.basename(path)}: {conflicts} rows conflict with existing rows.')
+
+        cursor.execute(f'DROP TABLE {staging}')
+        return pks
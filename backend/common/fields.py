@@ -0,0 +1,46 @@
+import uuid
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from common.utils import get_uuid_prefix
+
+
+class PrefixedUUIDField(models.UUIDField):
+    @property
+    def prefix(self) -> str:
+        return get_uuid_prefix(self.model.__name__)
+
+    def to_uuid(self, value):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+
+        prefix = f'{self.prefix}-'
+        try:
+            if not value.startswith(prefix):
+                raise ValueError
+            return uuid.UUID(value[len(prefix):])
+        except (AttributeError, ValueError):
+            raise ValidationError(self.error_messages['invalid'], code='invalid', params={'value': value})
+
+    def to_prefixed(self, value):
+        return None if value is None else f'{self.prefix}-{value}'
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.to_prefixed(value if isinstance(value, uuid.UUID) else uuid.UUID(value))
+
+    def to_python(self, value):
+        return self.to_prefixed(self.to_uuid(value))
+
+    def get_prep_value(self, value):
+        return self.to_uuid(models.Field.get_prep_value(self, value))
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+
+        if value is None or connection.features.has_native_uuid_field:
+            return value
+        return value.hex
@@ -0,0 +1,39 @@
+from functools import reduce
+from operator import and_, or_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from common.paginations import PageNumberPagination
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        search_fields = getattr(view, 'search_fields', None)
+        if not query or not search_fields:
+            return queryset
+        if PageNumberPagination().is_cursor_requested(request):
+            raise ValidationError({self.search_param: ['Cannot be combined with cursor pagination.']})
+
+        ordering = getattr(view, 'ordering', None) or queryset.model._meta.ordering
+        vector_field = getattr(view, 'search_vector_field', None)
+        if vector_field is None or connections[queryset.db].vendor != 'postgresql':
+            return queryset.filter(self.get_fallback_condition(query, search_fields))
+
+        search_query = SearchQuery(query, search_type='websearch', config=getattr(view, 'search_config', 'english'))
+        return queryset.filter(**{vector_field: search_query}).alias(
+            search_rank=SearchRank(F(vector_field), search_query)
+        ).order_by('-search_rank', *ordering)
+
+    @staticmethod
+    def get_fallback_condition(query, search_fields):
+        return reduce(and_, (
+            reduce(or_, (Q(**{f'{field}__icontains': term}) for field in search_fields))
+            for term in query.split()
+        ))
@@ -0,0 +1,199 @@
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULT = 'default'
+CONCURRENCY = 'concurrency'
+QUEUE = 'queue'
+
+INCREASE = 1.0
+DECREASE = 0.9
+
+# In-flight counts live in the shared cache so every worker process sees the same total; the timeout bounds how
+# long a count leaked by a killed worker can hold slots
+IN_FLIGHT_KEY = 'concurrency:{label}:in_flight'
+IN_FLIGHT_TIMEOUT = 300
+
+
+class Shed(Exception):
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Limiter:
+    def __init__(self, label, limit, min_limit, max_limit, latency, queue):
+        self.key = IN_FLIGHT_KEY.format(label=label)
+        self.limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency = latency
+        self.queue = queue
+        self.shed = {CONCURRENCY: 0, QUEUE: 0}
+
+    @property
+    def retry_after(self):
+        return max(math.ceil(self.latency), 1)
+
+    @property
+    def in_flight(self):
+        return cache.get(self.key, 0)
+
+    def check_queue(self, queue_time):
+        if self.queue is not None and queue_time > self.queue:
+            self.shed[QUEUE] += 1
+            raise Shed(QUEUE, self.retry_after)
+
+    def admit(self, in_flight):
+        if in_flight > int(self.limit):
+            self.shed[CONCURRENCY] += 1
+            raise Shed(CONCURRENCY, self.retry_after)
+
+    def adapt(self, in_flight, elapsed):
+        if elapsed > self.latency:
+            self.limit = max(self.limit * DECREASE, self.min_limit)
+        elif in_flight >= int(self.limit):
+            self.limit = min(self.limit + INCREASE / self.limit, self.max_limit)
+
+
+class Slot:
+    def __init__(self, registry, limiter):
+        self.registry = registry
+        self.limiter = limiter
+        self.started = time.monotonic()
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.registry.release(self.limiter, time.monotonic() - self.started)
+
+    async def arelease(self):
+        if not self.released:
+            self.released = True
+            await self.registry.arelease(self.limiter, time.monotonic() - self.started)
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.limiters = {}
+
+    def get_limiter(self, label, action):
+        with self.lock:
+            limiter = self.limiters.get(label)
+            if limiter is None:
+                limiter = self.limiters[label] = Limiter(label, **get_policy(action))
+        return limiter
+
+    def check_queue(self, limiter, queue_time):
+        with self.lock:
+            limiter.check_queue(queue_time)
+
+    def admit(self, limiter, in_flight):
+        with self.lock:
+            limiter.admit(in_flight)
+        return Slot(self, limiter)
+
+    def acquire(self, label, action, queue_time=0.0):
+        limiter = self.get_limiter(label, action)
+        self.check_queue(limiter, queue_time)
+        in_flight = increment(limiter.key)
+        try:
+            return self.admit(limiter, in_flight)
+        except Shed:
+            decrement(limiter.key)
+            raise
+
+    async def aacquire(self, label, action, queue_time=0.0):
+        limiter = self.get_limiter(label, action)
+        self.check_queue(limiter, queue_time)
+        in_flight = await aincrement(limiter.key)
+        try:
+            return self.admit(limiter, in_flight)
+        except Shed:
+            await adecrement(limiter.key)
+            raise
+
+    def adapt(self, limiter, in_flight, elapsed):
+        with self.lock:
+            limiter.adapt(in_flight, elapsed)
+
+    def release(self, limiter, elapsed):
+        self.adapt(limiter, decrement(limiter.key) + 1, elapsed)
+
+    async def arelease(self, limiter, elapsed):
+        self.adapt(limiter, await adecrement(limiter.key) + 1, elapsed)
+
+    def collect(self):
+        with self.lock:
+            limiters = list(self.limiters.items())
+        return [(label, limiter.limit, limiter.in_flight, dict(limiter.shed)) for label, limiter in limiters]
+
+    def clear(self):
+        with self.lock:
+            self.limiters.clear()
+
+
+registry = Registry()
+
+
+def increment(key):
+    for _ in range(2):
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, 0, IN_FLIGHT_TIMEOUT)
+    # A cache that cannot count (the dummy backend) admits every request
+    return 1
+
+
+async def aincrement(key):
+    for _ in range(2):
+        try:
+            return await cache.aincr(key)
+        except ValueError:
+            await cache.aadd(key, 0, IN_FLIGHT_TIMEOUT)
+    return 1
+
+
+def decrement(key):
+    try:
+        return cache.decr(key)
+    except ValueError:
+        return 0
+
+
+async def adecrement(key):
+    try:
+        return await cache.adecr(key)
+    except ValueError:
+        return 0
+
+
+def get_policy(action):
+    policies = settings.CONCURRENCY_LIMITS
+    return {**policies[DEFAULT], **policies.get(action, {})}
+
+
+def get_queue_time(request):
+    arrived = getattr(request, 'arrived', None)
+    queued = 0.0 if arrived is None else time.perf_counter() - arrived
+    return max(queued, get_upstream_queue_time(request))
+
+
+def get_upstream_queue_time(request):
+    try:
+        started = float(request.headers.get('X-Request-Start', '').removeprefix('t='))
+    except ValueError:
+        return 0.0
+
+    if not math.isfinite(started):
+        return 0.0
+    while started > 1e11:
+        started /= 1000
+    return max(time.time() - started, 0.0)
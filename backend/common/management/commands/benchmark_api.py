@@ -0,0 +1,42 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from common import benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Seed users and experiences, then benchmark every API endpoint against its query budget.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--experiences', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--output', help='Write results as JSON to this path.')
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded rows instead of rolling back.')
+
+    def handle(self, *args, **options):
+        if options['users'] <= options['repeat'] or options['experiences'] <= options['repeat']:
+            raise CommandError('Seed more users and experiences than --repeat so destroy has rows to delete.')
+
+        with transaction.atomic():
+            admin = benchmarks.seed(options['users'], options['experiences'])
+            results = benchmarks.run(admin, options['repeat'])
+            transaction.set_rollback(not options['keep'])
+
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:28} {result['p50_ms']:9.2f} ms p50 {result['max_ms']:9.2f} ms max "
+                f"{result['peak_kib']:8.1f} KiB {result['queries']:3}/{result['budget']} queries {result['statuses']}"
+            )
+
+        if options['output']:
+            volumes = {key: options[key] for key in ('users', 'experiences', 'repeat')}
+            environment = benchmarks.get_environment(**volumes)
+            with open(options['output'], 'w') as file:
+                json.dump({'environment': environment, 'results': results}, file, indent=2)
+
+        violations = benchmarks.get_violations(results)
+        if violations:
+            raise CommandError(f'Query budget or status violations: {", ".join(violations)}')
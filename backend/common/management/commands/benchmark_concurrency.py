@@ -0,0 +1,59 @@
+import asyncio
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient
+
+from apps.accounts.models import User
+from apps.jobs.models import Experience
+
+
+class Command(BaseCommand):
+    help = 'Compare sync and async viewsets under ASGI with many in-flight requests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--username', help='User to log in as for the users/me endpoints.')
+
+    def handle(self, *args, **options):
+        client = AsyncClient()
+        paths = ['experiences/']
+
+        experience = Experience.objects.first()
+        if experience is not None:
+            paths.append(f'experiences/{experience.uuid}/')
+
+        if options['username']:
+            client.force_login(User.objects.get(username=options['username']))
+            paths.extend(['users/', 'users/me/'])
+
+        for path in paths:
+            for prefix in ('/api/v1/', '/api/v1/async/'):
+                elapsed, latencies, statuses = asyncio.run(
+                    self.run(client, f'{prefix}{path}', options['requests'], options['concurrency'])
+                )
+                latencies.sort()
+                self.stdout.write(
+                    f'{prefix}{path}: {len(latencies) / elapsed:.0f} req/s, '
+                    f'p50 {statistics.median(latencies) * 1000:.1f} ms, '
+                    f'p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f} ms, '
+                    f'statuses {sorted(statuses)}'
+                )
+
+    @staticmethod
+    async def run(client, url, requests, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies, statuses = [], set()
+
+        async def fetch(index):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(url, {'_': index})
+                latencies.append(time.perf_counter() - started)
+                statuses.add(response.status_code)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch(index) for index in range(requests)))
+        return time.perf_counter() - started, latencies, statuses
@@ -0,0 +1,58 @@
+import timeit
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework import renderers, serializers
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from common import renderers as fast_renderers
+
+
+def get_page(rows):
+    now = timezone.now()
+    created_at = serializers.DateTimeField()
+    results = ReturnList([
+        {
+            'uuid': f'EXPERIENCE-{uuid.UUID(int=index)}',
+            'job_title': f'Senior Engineer {index}',
+            'description': 'Built data pipelines, APIs and dashboards for régional teams. ' * 4,
+            'company_name': 'Tech Solutions Co., Ltd.',
+            'working_period': 'Jan 2020 - Present (4 years 10 months)',
+            'created_at': created_at.to_representation(now - timedelta(minutes=index)),
+        }
+        for index in range(rows)
+    ], serializer=None)
+    return ReturnDict({'count': rows, 'next': None, 'previous': None, 'results': results}, serializer=None)
+
+
+class Command(BaseCommand):
+    help = 'Compare the project JSON renderer with the stdlib-based DRF renderer on paginated pages.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[30, 1000, 10000])
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        if fast_renderers.orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; the fast renderer falls back to DRF.'))
+
+        baseline, fast = renderers.JSONRenderer(), fast_renderers.JSONRenderer()
+        for rows in options['rows']:
+            page = get_page(rows)
+            expected = baseline.render(page, 'application/json')
+            if fast.render(page, 'application/json') != expected:
+                raise CommandError(f'Rendered output differs for {rows} rows.')
+
+            number = max(10000 // rows, 1)
+            timings = {
+                name: min(timeit.repeat(lambda: renderer.render(page, 'application/json'), number=number,
+                                        repeat=options['repeat'])) / number
+                for name, renderer in (('drf', baseline), ('fast', fast))
+            }
+            self.stdout.write(
+                f'{rows} rows ({len(expected) / 1024:.1f} KiB): '
+                f'drf {timings["drf"] * 1000:.3f} ms, fast {timings["fast"] * 1000:.3f} ms, '
+                f'{timings["drf"] / timings["fast"]:.1f}x'
+            )
@@ -0,0 +1,52 @@
+import random
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.accounts.models import User, UserProfile
+from apps.jobs.models import Experience
+
+
+class Command(BaseCommand):
+    help = 'Report public uuid index size and lookup latency for users and experiences.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lookups', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        randomizer = random.Random(options['seed'])
+
+        for model, queryset in ((UserProfile, User.objects.all()), (Experience, Experience.objects_with_deleted.all())):
+            uuids = list(queryset.values_list('uuid', flat=True))
+            self.stdout.write(f'{model.__name__}: {len(uuids)} rows, uuid index {self.get_index_size(model)}')
+            if not uuids:
+                continue
+
+            samples = [randomizer.choice(uuids) for _ in range(options['lookups'])]
+
+            def lookup():
+                for uuid in samples:
+                    queryset.filter(uuid=uuid).values_list('id', flat=True).first()
+
+            best = min(timeit.repeat(lookup, number=1, repeat=3))
+            self.stdout.write(f'  lookup: {best / len(samples) * 1_000_000:.1f} us per row')
+
+    @staticmethod
+    def get_index_size(model) -> str:
+        if connection.vendor != 'postgresql':
+            return 'n/a (requires PostgreSQL)'
+
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+            names = [
+                name for name, constraint in constraints.items()
+                if constraint['columns'] == ['uuid'] and (constraint['unique'] or constraint['index'])
+            ]
+            if not names:
+                return 'missing'
+
+            cursor.execute('SELECT pg_relation_size(%s::regclass)', [names[0]])
+            return f'{cursor.fetchone()[0] / 1024:.1f} KiB'
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from common import copies
+
+
+class Command(BaseCommand):
+    help = 'Stream users and experiences, soft-deleted rows included, to CSV chunks with PostgreSQL COPY.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory')
+        parser.add_argument('--models', nargs='+', default=copies.MODELS)
+        parser.add_argument('--batch-size', type=int, default=50000)
+
+    def handle(self, *args, **options):
+        try:
+            copies.export(options['directory'], options['models'], options['batch_size'], log=self.stdout.write)
+        except copies.CopyError as error:
+            raise CommandError(error)
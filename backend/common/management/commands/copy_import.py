@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from common import copies
+
+
+class Command(BaseCommand):
+    help = 'Load CSV chunks written by copy_export with PostgreSQL COPY, skipping chunks already imported.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory')
+        parser.add_argument('--models', nargs='+', default=copies.MODELS)
+
+    def handle(self, *args, **options):
+        try:
+            copies.load(options['directory'], options['models'], log=self.stdout.write)
+        except copies.CopyError as error:
+            raise CommandError(error)
@@ -0,0 +1,168 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import JsonResponse
+
+from common import limiters, timings
+
+UNRESOLVED = 'unresolved'
+
+
+class ServerTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        recorder = timings.Timings()
+        request.arrived = recorder.started
+        token = timings.current.set(recorder)
+        try:
+            response = self.get_response(request)
+        finally:
+            timings.current.reset(token)
+        return self.finish(recorder, response)
+
+    async def __acall__(self, request):
+        recorder = timings.Timings()
+        request.arrived = recorder.started
+        token = timings.current.set(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            timings.current.reset(token)
+        return self.finish(recorder, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        recorder = timings.current.get()
+        if recorder is not None:
+            recorder.label = self.get_label(request, view_func)
+
+    def process_template_response(self, request, response):
+        recorder = timings.current.get()
+        if recorder is not None:
+            started = time.perf_counter()
+            response.add_post_render_callback(
+                lambda rendered: recorder.add(timings.RENDER, time.perf_counter() - started)
+            )
+        return response
+
+    @staticmethod
+    def get_label(request, view_func):
+        view_class = getattr(view_func, 'cls', None)
+        if view_class is None:
+            return f'{view_func.__module__}.{view_func.__qualname__}'
+
+        method = request.method.lower()
+        actions = getattr(view_func, 'actions', None) or {}
+        return f'{view_class.__name__}.{actions.get(method, method)}'
+
+    @staticmethod
+    def finish(recorder, response):
+        values = recorder.finish()
+        timings.registry.observe(recorder.label or UNRESOLVED, values)
+        response['Server-Timing'] = recorder.get_header()
+        return response
+
+
+class ConcurrencyLimitMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            self.release(request)
+            raise
+        return self.release(request, response)
+
+    async def __acall__(self, request):
+        try:
+            response = await self.get_response(request)
+        except BaseException:
+            await self.arelease(request)
+            raise
+        return await self.arelease(request, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        action = self.get_action(request, view_func)
+        if action is None:
+            return None
+
+        try:
+            request.concurrency_slot = limiters.registry.acquire(*action, limiters.get_queue_time(request))
+        except limiters.Shed as exc:
+            return self.get_shed_response(exc)
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        action = self.get_action(request, view_func)
+        if action is None:
+            return None
+
+        try:
+            request.concurrency_slot = await limiters.registry.aacquire(*action, limiters.get_queue_time(request))
+        except limiters.Shed as exc:
+            return self.get_shed_response(exc)
+        return None
+
+    @staticmethod
+    def get_action(request, view_func):
+        view_class = getattr(view_func, 'cls', None)
+        if view_class is None:
+            return None
+
+        method = request.method.lower()
+        action = (getattr(view_func, 'actions', None) or {}).get(method, method)
+        return f'{view_class.__name__}.{action}', action
+
+    @staticmethod
+    def release(request, response=None):
+        slot = getattr(request, 'concurrency_slot', None)
+        if slot is None:
+            return response
+
+        if response is not None and response.streaming:
+            response._resource_closers.append(slot.release)
+        else:
+            slot.release()
+        return response
+
+    @staticmethod
+    async def arelease(request, response=None):
+        slot = getattr(request, 'concurrency_slot', None)
+        if slot is None:
+            return response
+
+        if response is not None and response.streaming:
+            response._resource_closers.append(slot.release)
+        else:
+            await slot.arelease()
+        return response
+
+    @staticmethod
+    def get_shed_response(exc):
+        return JsonResponse(
+            {'detail': 'Server is busy, please retry later.'},
+            status=503,
+            headers={'Retry-After': str(exc.retry_after)}
+        )
@@ -1,10 +1,44 @@
+import csv
+import hashlib
+from calendar import timegm
+from datetime import datetime
+from itertools import islice
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import Http404, StreamingHttpResponse
+from django.urls import NoReverseMatch
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import status
+from rest_framework.authentication import get_authorization_header
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.exceptions import ValidationError as APIValidationError
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.viewsets import GenericViewSet
 
-from common.constants import WRITABLE_ACTIONS, PARTIAL_UPDATE
+from common import caches
+from common.constants import (
+    WRITABLE_ACTIONS, PARTIAL_UPDATE, BULK_PARTIAL_UPDATE, READABLE_ACTIONS, RETRIEVE, RETURN_MINIMAL
+)
+from common.serializers import CompiledModelSerializer
+from common.utils import get_return_preference
+
+
+def get_current_month(serializer_class):
+    if not getattr(serializer_class, 'varies_by_month', False):
+        return None
+    return timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
 class ReadWritableSerializerMixin(GenericViewSet):
@@ -27,10 +61,11 @@ class ReadWritableSerializerMixin(GenericViewSet):
         return action in WRITABLE_ACTIONS
 
     def get_writable_serializer(self, action):
-        if action == PARTIAL_UPDATE:
+        if action in (PARTIAL_UPDATE, BULK_PARTIAL_UPDATE):
             return (
                     self.partial_update_serializer or
                     self.update_serializer or
+                    self.writable_serializer or
                     super().get_serializer_class()
             )
 
@@ -47,24 +82,184 @@ class ReadWritableSerializerMixin(GenericViewSet):
                 super().get_serializer_class()
         )
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != RETRIEVE:
+            return queryset
+
+        plan = self.get_plan(self.get_serializer())
+        return queryset if plan is None else queryset.only(*plan.columns)
+
+    @staticmethod
+    def get_plan(serializer):
+        return serializer.get_selected_plan() if isinstance(serializer, CompiledModelSerializer) else None
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer()
+        plan = self.get_plan(serializer)
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = getattr(self, 'ordering', None) or queryset.model._meta.ordering
+        rows = queryset.values(*plan.get_columns(field.lstrip('-') for field in ordering))
+
+        page = self.paginate_queryset(rows)
+        data = plan.render(serializer, page if page is not None else rows)
+        if page is not None:
+            return self.get_paginated_response(data)
+
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.serialize(self.get_object()))
+
+    async def alist(self, request, *args, **kwargs):
+        serializer = self.get_serializer()
+        plan = self.get_plan(serializer)
+        if plan is None:
+            return await sync_to_async(super().list)(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = getattr(self, 'ordering', None) or queryset.model._meta.ordering
+        rows = queryset.values(*plan.get_columns(field.lstrip('-') for field in ordering))
+
+        page = await self.apaginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(await plan.arender(serializer, page))
+
+        return Response(await plan.arender(serializer, [row async for row in rows.aiterator()]))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return Response(await self.aserialize(await self.aget_object()))
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+
+        if not hasattr(self.paginator, 'apaginate_queryset'):
+            return await sync_to_async(self.paginate_queryset)(queryset)
+        return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+
+        try:
+            instance = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    def serialize(self, instance):
+        return self.serialize_with(self.get_serializer(instance), instance)
+
+    def represent(self, instance):
+        serializer_class = self.get_readable_serializer(RETRIEVE)
+        return self.serialize_with(serializer_class(instance, context=self.get_serializer_context()), instance)
+
+    def represent_many(self, instances):
+        serializer_class = self.get_readable_serializer(RETRIEVE)
+        serializer = serializer_class(instances, many=True, context=self.get_serializer_context())
+        plan = self.get_plan(serializer.child)
+        if plan is None:
+            return serializer.data
+        return plan.render(serializer.child, [plan.get_row(instance) for instance in instances])
+
+    def serialize_with(self, serializer, instance):
+        plan = self.get_plan(serializer)
+        if plan is None:
+            return serializer.data
+
+        data, = plan.render(serializer, [plan.get_row(instance)])
+        return data
+
+    async def aserialize(self, instance):
+        serializer = self.get_serializer(instance)
+        plan = self.get_plan(serializer)
+        if plan is None:
+            return await sync_to_async(lambda: serializer.data)()
+
+        data, = await plan.arender(serializer, [plan.get_row(instance)])
+        return data
+
+
+class LazyAuthenticationMixin(GenericViewSet):
+    def perform_authentication(self, request):
+        pass
+
+
+class AsyncViewSetMixin(GenericViewSet):
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = self.get_handler(request)
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def get_handler(self, request):
+        method = request.method.lower()
+        if method not in self.http_method_names:
+            return self.http_method_not_allowed
+        return getattr(self, method, self.http_method_not_allowed)
+
+    async def list(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+    async def retrieve(self, request, *args, **kwargs):
+        return await self.aretrieve(request, *args, **kwargs)
+
 
 class CreateModelMixin(GenericViewSet):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
-        return Response(status=status.HTTP_201_CREATED, headers=headers)
+        caches.invalidate(self.get_queryset().model)
+        return self.get_created_response(request, serializer.instance)
+
+    def get_created_response(self, request, instance):
+        preference = get_return_preference(request)
+        headers = self.get_success_headers(instance, preference)
+        if preference == RETURN_MINIMAL:
+            return Response(status=status.HTTP_201_CREATED, headers=headers)
+        return Response(self.represent(instance), status=status.HTTP_201_CREATED, headers=headers)
 
     def perform_create(self, serializer):
-        serializer.save(created_at=timezone.now(), created_user=self.request.user)
+        serializer.save(**self.get_create_kwargs())
 
-    @staticmethod
-    def get_success_headers(data):
+    def get_create_kwargs(self):
+        return {'created_at': timezone.now(), 'created_user': self.request.user}
+
+    def get_success_headers(self, instance, preference):
+        headers = {'Preference-Applied': preference}
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
         try:
-            return {'Location': str(data[api_settings.URL_FIELD_NAME])}
-        except (TypeError, KeyError):
-            return {}
+            headers['Location'] = self.reverse_action('detail', kwargs={
+                lookup_url_kwarg: getattr(instance, self.lookup_field)
+            })
+        except NoReverseMatch:
+            pass
+        return headers
 
 
 class UpdateModelMixin(GenericViewSet):
@@ -74,6 +269,7 @@ class UpdateModelMixin(GenericViewSet):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
+        caches.invalidate(self.get_queryset().model)
 
         if getattr(instance, '_prefetched_objects_cache', None):
             instance._prefetched_objects_cache = {}
@@ -81,7 +277,10 @@ class UpdateModelMixin(GenericViewSet):
         return Response()
 
     def perform_update(self, serializer):
-        serializer.save(updated_at=timezone.now(), updated_user=self.request.user)
+        serializer.save(**self.get_update_kwargs())
+
+    def get_update_kwargs(self):
+        return {'updated_at': timezone.now(), 'updated_user': self.request.user}
 
     def partial_update(self, request, *args, **kwargs):
         kwargs['partial'] = True
@@ -92,7 +291,393 @@ class DestroyModelMixin(GenericViewSet):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
+        caches.invalidate(self.get_queryset().model)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_destroy(self, instance):
         instance.delete(user=self.request.user)
+
+
+def normalize_lookup(model, field_name, value):
+    try:
+        return model._meta.get_field(field_name).to_python(value)
+    except ValidationError:
+        return None
+
+
+class SoftDeleteModelMixin(GenericViewSet):
+    def get_deleted_queryset(self):
+        return self.get_queryset().model.objects_deleted.all()
+
+    @action(detail=True, methods=['post'])
+    def restore(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_deleted_queryset())
+        instance = get_object_or_404(queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        self.check_object_permissions(request, instance)
+        instance.restore(**self.get_update_kwargs())
+        return Response()
+
+    @action(detail=False, methods=['post'], url_path='bulk-delete')
+    def bulk_destroy(self, request, *args, **kwargs):
+        queryset = self.get_bulk_queryset(request, self.get_queryset())
+        return Response({'count': queryset.delete(user=request.user)})
+
+    @action(detail=False, methods=['post'], url_path='bulk-restore')
+    def bulk_restore(self, request, *args, **kwargs):
+        queryset = self.get_bulk_queryset(request, self.get_deleted_queryset())
+        count = queryset.restore(**self.get_update_kwargs())
+        return Response({'count': count})
+
+    def get_bulk_queryset(self, request, queryset):
+        lookups = request.data.get(f'{self.lookup_field}s') if isinstance(request.data, dict) else None
+        filtered_queryset = self.filter_queryset(queryset)
+
+        if lookups is None:
+            if filtered_queryset.query.where == queryset.query.where:
+                raise APIValidationError({
+                    api_settings.NON_FIELD_ERRORS_KEY: [f'Provide a list of {self.lookup_field}s or a filter.']
+                })
+            return filtered_queryset
+
+        if not isinstance(lookups, list) or not all(isinstance(lookup, str) for lookup in lookups):
+            raise APIValidationError({f'{self.lookup_field}s': ['Expected a list of strings.']})
+
+        lookups = [normalize_lookup(queryset.model, self.lookup_field, lookup) for lookup in lookups]
+        return filtered_queryset.filter(**{f'{self.lookup_field}__in': [lookup for lookup in lookups if lookup]})
+
+
+class BulkModelMixin(GenericViewSet):
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        instances = self.perform_bulk_create(serializer)
+        caches.invalidate(self.get_queryset().model)
+
+        preference = get_return_preference(request)
+        if preference == RETURN_MINIMAL:
+            data = [{self.lookup_field: getattr(instance, self.lookup_field)} for instance in instances]
+        else:
+            data = self.represent_many(instances)
+        return Response(data, status=status.HTTP_201_CREATED, headers={'Preference-Applied': preference})
+
+    def perform_bulk_create(self, serializer):
+        model = self.get_queryset().model
+        kwargs = self.get_create_kwargs()
+        instances = [model(**attrs, **kwargs) for attrs in serializer.validated_data]
+        for instance in instances:
+            instance.prepare_save()
+
+        with transaction.atomic():
+            return model._default_manager.bulk_create(instances)
+
+    @action(detail=False, methods=['patch'], url_path='bulk')
+    def bulk_partial_update(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            raise APIValidationError({api_settings.NON_FIELD_ERRORS_KEY: ['Expected a list of items.']})
+
+        lookups = [self.get_bulk_lookup(item) for item in request.data]
+        instances = self.get_queryset().in_bulk([lookup for lookup in lookups if lookup], field_name=self.lookup_field)
+        serializers, errors, seen = [], [], set()
+
+        for item, lookup in zip(request.data, lookups):
+            instance = instances.get(lookup) if lookup else None
+            if instance is None or lookup in seen:
+                message = 'Not found.' if instance is None else 'Duplicate item.'
+                errors.append({self.lookup_field: [message]})
+                continue
+
+            seen.add(lookup)
+            data = {key: value for key, value in item.items() if key != self.lookup_field}
+            serializer = self.get_serializer(instance, data=data, partial=True)
+            errors.append({} if serializer.is_valid() else serializer.errors)
+            serializers.append(serializer)
+
+        if any(errors):
+            raise APIValidationError(errors)
+
+        self.perform_bulk_update(serializers)
+        caches.invalidate(self.get_queryset().model)
+        return Response()
+
+    def get_bulk_lookup(self, item):
+        lookup = item.get(self.lookup_field) if isinstance(item, dict) else None
+        if not isinstance(lookup, str):
+            return None
+        return normalize_lookup(self.get_queryset().model, self.lookup_field, lookup)
+
+    def perform_bulk_update(self, serializers):
+        kwargs = self.get_update_kwargs()
+        fields = set(kwargs)
+        instances = []
+
+        for serializer in serializers:
+            for attr, value in {**serializer.validated_data, **kwargs}.items():
+                setattr(serializer.instance, attr, value)
+            fields.update(serializer.validated_data)
+            instances.append(serializer.instance)
+
+        with transaction.atomic():
+            self.get_queryset().model._default_manager.bulk_update(instances, fields=sorted(fields))
+
+
+class Echo:
+    @staticmethod
+    def write(value):
+        return value
+
+
+class ExportModelMixin(GenericViewSet):
+    export_chunk_size = 2000
+    export_format_query_param = 'export_format'
+    export_content_types = {
+        'ndjson': 'application/x-ndjson',
+        'csv': 'text/csv',
+    }
+
+    @action(detail=False)
+    def export(self, request, *args, **kwargs):
+        export_format = request.query_params.get(self.export_format_query_param, 'ndjson')
+        if export_format not in self.export_content_types:
+            raise APIValidationError({
+                self.export_format_query_param: [f'Expected one of: {", ".join(self.export_content_types)}.']
+            })
+
+        serializer = self.get_serializer()
+        plan = serializer.get_selected_plan() if isinstance(serializer, CompiledModelSerializer) else None
+        if plan is None:
+            raise APIValidationError({api_settings.NON_FIELD_ERRORS_KEY: ['Export is not available.']})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = getattr(self, 'ordering', None) or queryset.model._meta.ordering
+        columns = plan.get_columns(field.lstrip('-') for field in ordering)
+        if not queryset.query.order_by:
+            queryset = queryset.order_by(*ordering)
+        rows = queryset.values(*columns)
+        header, encode = self.get_csv_encoder(plan) if export_format == 'csv' else self.get_ndjson_encoder()
+
+        if isinstance(request._request, ASGIRequest):
+            rows = rows.aiterator(chunk_size=self.export_chunk_size)
+            lines = self.aiterate_export(serializer, plan, rows, header, encode)
+        else:
+            rows = rows.iterator(chunk_size=self.export_chunk_size)
+            lines = self.iterate_export(serializer, plan, rows, header, encode)
+
+        response = StreamingHttpResponse(lines, content_type=self.export_content_types[export_format])
+        filename = f'{queryset.model._meta.model_name}s.{export_format}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def iterate_export(self, serializer, plan, rows, header, encode):
+        if header:
+            yield header
+        while True:
+            chunk = list(islice(rows, self.export_chunk_size))
+            if not chunk:
+                return
+            yield ''.join(map(encode, plan.render(serializer, chunk)))
+
+    async def aiterate_export(self, serializer, plan, rows, header, encode):
+        if header:
+            yield header
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) == self.export_chunk_size:
+                yield ''.join(map(encode, await plan.arender(serializer, chunk)))
+                chunk = []
+        if chunk:
+            yield ''.join(map(encode, await plan.arender(serializer, chunk)))
+
+    @staticmethod
+    def get_ndjson_encoder():
+        encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        return '', lambda item: encoder.encode(item) + '\n'
+
+    @staticmethod
+    def get_csv_encoder(plan):
+        names = plan.get_field_names()
+        writer = csv.DictWriter(Echo(), fieldnames=names)
+        return writer.writerow(dict(zip(names, names))), writer.writerow
+
+
+class CacheResponseMixin(GenericViewSet):
+    cache_timeout = None
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_cached_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.aget_cached_response(super().aretrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        if self.cache_timeout is None or self.action not in READABLE_ACTIONS:
+            return handler(request, *args, **kwargs)
+
+        model = self.get_queryset().model
+        key = caches.get_response_key(model, self.get_cache_path(request), self.get_cache_auth(request))
+        cached = cache.get(key)
+        if cached is not None:
+            caches.count(model, caches.HITS)
+            return self.get_hit_response(request, *cached)
+
+        caches.count(model, caches.MISSES)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, self.get_cache_entry(response), self.cache_timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    async def aget_cached_response(self, handler, request, *args, **kwargs):
+        if self.cache_timeout is None or self.action not in READABLE_ACTIONS:
+            return await handler(request, *args, **kwargs)
+
+        model = self.get_queryset().model
+        key = await caches.aget_response_key(model, self.get_cache_path(request), self.get_cache_auth(request))
+        cached = await cache.aget(key)
+        if cached is not None:
+            await caches.acount(model, caches.HITS)
+            return self.get_hit_response(request, *cached)
+
+        await caches.acount(model, caches.MISSES)
+        response = await handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            await cache.aset(key, self.get_cache_entry(response), self.cache_timeout)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def get_cache_entry(self, response):
+        return response.data, response.status_code, getattr(self, 'validators', None)
+
+    def get_hit_response(self, request, data, status_code, validators=None):
+        if validators is not None:
+            self.validators = validators
+            response = self.get_not_modified_response(request)
+            if response is not None:
+                return response
+        return Response(data, status=status_code, headers={'X-Cache': 'HIT'})
+
+    def get_cache_path(self, request):
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        month = get_current_month(self.get_serializer_class())
+        return f'{request.path}?{query}' if month is None else f'{request.path}?{query}#{month:%Y-%m}'
+
+    @staticmethod
+    def get_cache_auth(request):
+        scheme = get_authorization_header(request).split()[:1]
+        if scheme:
+            return scheme[0].decode('latin-1').lower()
+        return 'session' if settings.SESSION_COOKIE_NAME in request.COOKIES else 'anonymous'
+
+
+class ConditionalGetMixin(GenericViewSet):
+    conditional_fields = ()
+    validators = None
+
+    # Hard deletes leave no timestamp behind, so lists are validated by their ETag only
+    def list(self, request, *args, **kwargs):
+        if self.conditional_fields:
+            self.set_validators(request, self.get_list_conditional_values(), dated=False)
+        return self.get_not_modified_response(request) or super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.conditional_fields:
+            self.set_validators(request, self.get_retrieve_conditional_values())
+        return self.get_not_modified_response(request) or super().retrieve(request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        if self.conditional_fields:
+            self.set_validators(request, await self.aget_list_conditional_values(), dated=False)
+        return self.get_not_modified_response(request) or await super().alist(request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        if self.conditional_fields:
+            self.set_validators(request, await self.aget_retrieve_conditional_values())
+        return self.get_not_modified_response(request) or await super().aretrieve(request, *args, **kwargs)
+
+    def get_list_conditional_values(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        values = queryset.aggregate(**self.get_list_conditional_aggregates())
+
+        deleted_queryset = self.get_list_conditional_deleted_queryset()
+        if deleted_queryset is not None:
+            values.update(deleted_queryset.aggregate(deleted_at=Max('deleted_at')))
+
+        return values
+
+    async def aget_list_conditional_values(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        values = await queryset.aaggregate(**self.get_list_conditional_aggregates())
+
+        deleted_queryset = self.get_list_conditional_deleted_queryset()
+        if deleted_queryset is not None:
+            values.update(await deleted_queryset.aaggregate(deleted_at=Max('deleted_at')))
+
+        return values
+
+    def get_list_conditional_aggregates(self):
+        return {'count': Count('pk'), **{field: Max(field) for field in self.conditional_fields}}
+
+    def get_list_conditional_deleted_queryset(self):
+        get_deleted_queryset = getattr(self, 'get_deleted_queryset', None)
+        if get_deleted_queryset is None:
+            return None
+        return self.filter_queryset(get_deleted_queryset())
+
+    def get_retrieve_conditional_values(self):
+        try:
+            return self.get_retrieve_conditional_queryset().first()
+        except (TypeError, ValueError, ValidationError):
+            return None
+
+    async def aget_retrieve_conditional_values(self):
+        try:
+            return await self.get_retrieve_conditional_queryset().afirst()
+        except (TypeError, ValueError, ValidationError):
+            return None
+
+    def get_retrieve_conditional_queryset(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        return queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).values(*self.conditional_fields)
+
+    def set_validators(self, request, values, dated=True):
+        if values is None:
+            return
+
+        month = get_current_month(self.get_serializer_class())
+        if month is not None:
+            values = {**values, 'month': month}
+
+        key = (request.get_full_path(), request.accepted_media_type, sorted(values.items()))
+        etag = f'W/"{hashlib.md5(repr(key).encode()).hexdigest()}"'
+        timestamps = [value for value in values.values() if isinstance(value, datetime)]
+        last_modified = timegm(max(timestamps).utctimetuple()) if dated and timestamps else None
+        self.validators = (etag, last_modified)
+
+    def get_not_modified_response(self, request):
+        if self.validators is None:
+            return None
+
+        etag, last_modified = self.validators
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if self.validators is not None and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            etag, last_modified = self.validators
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+
+        return response
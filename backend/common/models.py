@@ -2,12 +2,15 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from common import caches
+from common.fields import PrefixedUUIDField
 from common.managers import SoftDeleteManager
+from common.querysets import WITHOUT_DELETED, ONLY_DELETED
 from common.utils import generate_uuid
 
 
 class Timestamp(models.Model):
-    uuid = models.CharField(max_length=100, editable=False, unique=True)
+    uuid = PrefixedUUIDField(editable=False, unique=True)
     created_at = models.DateTimeField(editable=False)
     updated_at = models.DateTimeField(null=True, blank=True)
     created_user = models.ForeignKey(
@@ -28,11 +31,13 @@ class Timestamp(models.Model):
         abstract = True
 
     def save(self, *args, **kwargs):
+        self.prepare_save()
+        super().save(*args, **kwargs)
+
+    def prepare_save(self):
         if not self.uuid:
             self.uuid = generate_uuid(self.__class__.__name__)
 
-        super().save(*args, **kwargs)
-
 
 class SoftDelete(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
@@ -53,19 +58,41 @@ class SoftDelete(models.Model):
 
     def delete(self, using=None, keep_parents=False, hard=False, user=None):
         if hard:
-            return super().delete(using, keep_parents)
+            result = super().delete(using, keep_parents)
+            caches.invalidate(self.__class__)
+            return result
 
         self.deleted_at = timezone.now()
         self.deleted_user = user
-        self.save()
+        self.save(update_fields=['deleted_at', 'deleted_user'])
+        caches.invalidate(self.__class__)
 
-    def restore(self):
+    def restore(self, **kwargs):
         self.deleted_at = None
         self.deleted_user = None
-        self.save()
+        for field, value in kwargs.items():
+            setattr(self, field, value)
+
+        self.save(update_fields=['deleted_at', 'deleted_user', *kwargs])
+        caches.invalidate(self.__class__)
 
 
 class Model(Timestamp, SoftDelete, models.Model):
     class Meta:
         abstract = True
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='%(app_label)s_%(class)s_live_idx',
+                condition=WITHOUT_DELETED
+            ),
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='%(app_label)s_%(class)s_trash_idx',
+                condition=ONLY_DELETED
+            ),
+        ]
+
+    def restore(self, **kwargs):
+        super().restore(**{'updated_at': timezone.now(), **kwargs})
@@ -0,0 +1,65 @@
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+
+
+class CursorPagination(pagination.CursorPagination):
+    def get_ordering(self, request, queryset, view):
+        self.ordering = getattr(view, 'ordering', None) or queryset.model._meta.ordering
+        return super().get_ordering(request, queryset, view)
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    pagination_query_param = 'pagination'
+    cursor_pagination_class = CursorPagination
+    cursor_paginator = None
+
+    def is_cursor_requested(self, request):
+        return (
+                request.query_params.get(self.pagination_query_param) == 'cursor' or
+                self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_cursor_requested(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_paginator = self.cursor_pagination_class()
+        self.cursor_paginator.page_size = self.page_size
+        page = self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.display_page_controls = self.cursor_paginator.display_page_controls
+        return page
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        if self.is_cursor_requested(request):
+            return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        return [item async for item in self.page.object_list]
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
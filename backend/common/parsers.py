@@ -0,0 +1,31 @@
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+from rest_framework.utils import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONParser(parsers.JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            content = stream.read().decode(encoding)
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+
+        try:
+            return json.loads(content, parse_constant=json.strict_constant if self.strict else None)
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
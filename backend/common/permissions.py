@@ -4,6 +4,6 @@ from rest_framework.permissions import BasePermission, SAFE_METHODS
 class IsAdminUserOrReadOnly(BasePermission):
     def has_permission(self, request, view):
         return bool(
-            (request.user and request.user.is_staff) or
-            request.method in SAFE_METHODS
+            request.method in SAFE_METHODS or
+            (request.user and request.user.is_staff)
         )
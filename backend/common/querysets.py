@@ -1,19 +1,29 @@
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 
+from common import caches
+
+WITHOUT_DELETED = Q(deleted_at__isnull=True, deleted_user__isnull=True)
+ONLY_DELETED = Q(deleted_at__isnull=False, deleted_user__isnull=False)
+
 
 class SoftDeleteQuerySet(QuerySet):
     def only_deleted(self):
-        return self.filter(deleted_at__isnull=False, deleted_user__isnull=False)
+        return self.filter(ONLY_DELETED)
 
     def without_deleted(self):
-        return self.filter(deleted_at__isnull=True, deleted_user__isnull=True)
+        return self.filter(WITHOUT_DELETED)
 
     def delete(self, hard=False, user=None):
         if hard:
-            return super().delete()
+            result = super().delete()
+        else:
+            result = super().update(deleted_at=timezone.now(), deleted_user=user)
 
-        return super().update(deleted_at=timezone.now(), deleted_user=user)
+        caches.invalidate(self.model)
+        return result
 
-    def restore(self):
-        return super().update(deleted_at=None, deleted_user=None)
+    def restore(self, **kwargs):
+        count = super().update(deleted_at=None, deleted_user=None, **kwargs)
+        caches.invalidate(self.model)
+        return count
@@ -0,0 +1,48 @@
+import math
+import re
+
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATORS = (('\u2028'.encode(), b'\\u2028'), ('\u2029'.encode(), b'\\u2029'))
+# What orjson writes for floats that json formats differently: NaN/Infinity as null,
+# exponents without a sign (1e16 for 1e+16) and small values in full (0.00001 for 1e-05)
+FLOAT_MISMATCH = re.compile(rb'null|[0-9]e|0\.0000')
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    options = orjson and orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+                orjson is None or data is None or self.ensure_ascii or not self.compact or
+                self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if FLOAT_MISMATCH.search(ret) and has_mismatched_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in ret:
+                ret = ret.replace(separator, escaped)
+        return ret
+
+
+def has_mismatched_float(data):
+    if isinstance(data, float):
+        return not math.isfinite(data) or data != 0 and not 1e-4 <= abs(data) < 1e16
+    if isinstance(data, dict):
+        return any(has_mismatched_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_mismatched_float(value) for value in data)
+    return False
@@ -0,0 +1,256 @@
+from collections import defaultdict
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+
+from common import timings
+
+IDENTITY = 'identity'
+CONVERTED = 'converted'
+METHOD = 'method'
+CALLABLE = 'callable'
+MANY = 'many'
+
+IDENTITY_REPRESENTATIONS = (
+    serializers.CharField.to_representation,
+    serializers.IntegerField.to_representation,
+    serializers.BooleanField.to_representation,
+)
+
+
+class SerializerPlan:
+    def __init__(self, model, fields, columns):
+        self.model = model
+        self.fields = fields
+        self.columns = columns
+
+    @classmethod
+    def compile(cls, serializer_class) -> Optional['SerializerPlan']:
+        model = serializer_class.Meta.model
+        sources = getattr(serializer_class.Meta, 'compiled_sources', {})
+        fields = []
+
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+
+            if name in sources:
+                step = cls.compile_computed_field(model, field, sources[name])
+            elif isinstance(field, ManyRelatedField):
+                step = cls.compile_many_field(model, field)
+            else:
+                step = cls.compile_model_field(model, field)
+
+            if step is None:
+                return None
+            fields.append((name, *step))
+
+        return cls(model, fields, cls.get_field_columns(model, fields))
+
+    @staticmethod
+    def get_field_columns(model, fields) -> list:
+        columns = [model._meta.pk.attname]
+        for _, kind, argument, extra in fields:
+            if kind in (IDENTITY, CONVERTED):
+                columns.append(argument)
+            elif kind in (METHOD, CALLABLE):
+                columns.extend(extra)
+        return list(dict.fromkeys(columns))
+
+    def get_field_names(self) -> list:
+        return [name for name, *_ in self.fields]
+
+    def select(self, names) -> 'SerializerPlan':
+        fields = [field for field in self.fields if field[0] in names]
+        return SerializerPlan(self.model, fields, self.get_field_columns(self.model, fields))
+
+    @staticmethod
+    def compile_computed_field(model, field, sources):
+        if isinstance(field, serializers.SerializerMethodField):
+            return METHOD, field.method_name, tuple(sources)
+
+        attribute = getattr(model, field.source, None)
+        if not callable(attribute):
+            return None
+        return CALLABLE, (attribute, field.to_representation), tuple(sources)
+
+    @staticmethod
+    def compile_many_field(model, field):
+        child = field.child_relation
+        if not isinstance(child, PrimaryKeyRelatedField) or child.pk_field is not None:
+            return None
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+
+        if not model_field.many_to_many or not model_field.concrete:
+            return None
+        return MANY, model_field, None
+
+    @staticmethod
+    def compile_model_field(model, field):
+        if field.source == '*' or '.' in field.source:
+            return None
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+
+        if model_field.is_relation:
+            if not isinstance(field, PrimaryKeyRelatedField) or field.pk_field is not None:
+                return None
+            return IDENTITY, model_field.attname, None
+
+        if type(field).to_representation in IDENTITY_REPRESENTATIONS:
+            return IDENTITY, model_field.attname, None
+        return CONVERTED, model_field.attname, field.to_representation
+
+    def get_columns(self, extra_columns=()):
+        return list(dict.fromkeys([*self.columns, *extra_columns]))
+
+    def get_row(self, instance) -> dict:
+        return {column: getattr(instance, column) for column in self.columns}
+
+    def render(self, serializer, rows, related=None) -> list:
+        rows = list(rows)
+        if related is None:
+            related = self.fetch_related(rows)
+
+        with timings.timed(timings.SERIALIZER):
+            getters = [
+                (name, self.bind(serializer, kind, argument, extra, related))
+                for name, kind, argument, extra in self.fields
+            ]
+            return [{name: getter(row) for name, getter in getters} for row in rows]
+
+    async def arender(self, serializer, rows) -> list:
+        rows = list(rows)
+        return self.render(serializer, rows, await self.afetch_related(rows))
+
+    def bind(self, serializer, kind, argument, extra, related):
+        pk = self.model._meta.pk.attname
+
+        if kind == IDENTITY:
+            return itemgetter(argument)
+
+        if kind == CONVERTED:
+            return lambda row: None if row[argument] is None else extra(row[argument])
+
+        if kind == METHOD:
+            method = getattr(serializer, argument)
+            return lambda row: method(SimpleNamespace(**{source: row[source] for source in extra}))
+
+        if kind == CALLABLE:
+            attribute, to_representation = argument
+
+            def get_value(row):
+                value = attribute(SimpleNamespace(**{source: row[source] for source in extra}))
+                return None if value is None else to_representation(value)
+
+            return get_value
+
+        return lambda row: related[argument].get(row[pk], [])
+
+    def get_many_fields(self):
+        return [argument for _, kind, argument, _ in self.fields if kind == MANY]
+
+    def fetch_related(self, rows) -> dict:
+        pks = [row[self.model._meta.pk.attname] for row in rows]
+        return {model_field: self.fetch_many(model_field, pks) for model_field in self.get_many_fields()}
+
+    async def afetch_related(self, rows) -> dict:
+        pks = [row[self.model._meta.pk.attname] for row in rows]
+        return {model_field: await self.afetch_many(model_field, pks) for model_field in self.get_many_fields()}
+
+    @staticmethod
+    def get_many_queryset(model_field, pks):
+        query_name = model_field.related_query_name()
+        target = model_field.related_model._default_manager.filter(**{f'{query_name}__in': pks})
+        return target.values_list(query_name, 'pk')
+
+    @classmethod
+    def fetch_many(cls, model_field, pks) -> dict:
+        related = defaultdict(list)
+        if not pks:
+            return related
+
+        for source_pk, target_pk in cls.get_many_queryset(model_field, pks):
+            related[source_pk].append(target_pk)
+        return related
+
+    @classmethod
+    async def afetch_many(cls, model_field, pks) -> dict:
+        related = defaultdict(list)
+        if not pks:
+            return related
+
+        async for source_pk, target_pk in cls.get_many_queryset(model_field, pks):
+            related[source_pk].append(target_pk)
+        return related
+
+
+class CompiledModelSerializer(serializers.ModelSerializer):
+    fields_query_param = 'fields'
+    exclude_query_param = 'exclude'
+
+    @classmethod
+    def get_plan(cls) -> Optional[SerializerPlan]:
+        if '_plan' not in cls.__dict__:
+            cls._plan = SerializerPlan.compile(cls)
+        return cls._plan
+
+    def get_selected_plan(self) -> Optional[SerializerPlan]:
+        plan = self.get_plan()
+        if plan is None:
+            return None
+
+        names = plan.get_field_names()
+        selected = self.get_selected_field_names(names)
+        return plan if len(selected) == len(names) else plan.select(selected)
+
+    def get_selected_field_names(self, names) -> list:
+        request = self.context.get('request')
+        if request is None or not self.is_root():
+            return list(names)
+
+        params = getattr(request, 'query_params', request.GET)
+        included = self.get_query_names(params, self.fields_query_param)
+        excluded = self.get_query_names(params, self.exclude_query_param)
+        errors = {
+            param: [f'Unknown fields: {", ".join(sorted(unknown))}.']
+            for param, unknown in (
+                (self.fields_query_param, included.difference(names)),
+                (self.exclude_query_param, excluded.difference(names)),
+            )
+            if unknown
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        return [name for name in names if (not included or name in included) and name not in excluded]
+
+    @staticmethod
+    def get_query_names(params, param) -> set:
+        return {name.strip() for value in params.getlist(param) for name in value.split(',') if name.strip()}
+
+    def is_root(self) -> bool:
+        parent = self.parent
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        return {name: fields[name] for name in self.get_selected_field_names(fields)}
+
+    @property
+    def data(self):
+        with timings.timed(timings.SERIALIZER):
+            return super().data
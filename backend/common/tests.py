@@ -0,0 +1,465 @@
+import io
+import json
+import math
+import tempfile
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import URLResolver, reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import renderers, status
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APITestCase
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from apps.accounts.models import User
+from apps.jobs.models import Experience
+from common import benchmarks, checks, copies, limiters, parsers, renderers as fast_renderers
+from common.management.commands.benchmark_renderer import get_page
+from config.postgresql_pool.pool import ConnectionPool, PoolTimeout
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def get_pool(self, **kwargs) -> ConnectionPool:
+        return ConnectionPool(close=Connection.close, check=lambda connection: not connection.closed, **kwargs)
+
+    def test_reuses_released_connection(self) -> None:
+        pool = self.get_pool(max_size=2)
+        connection = pool.getconn(Connection)
+        pool.putconn(connection)
+
+        self.assertIs(pool.getconn(Connection), connection)
+        self.assertEqual(pool.get_stats()['connections'], 1)
+        self.assertEqual(pool.get_stats()['in_use'], 1)
+
+    def test_discards_unhealthy_connection_on_checkout(self) -> None:
+        pool = self.get_pool(max_size=1)
+        connection = pool.getconn(Connection)
+        pool.putconn(connection)
+        connection.closed = True
+
+        self.assertIsNot(pool.getconn(Connection), connection)
+        self.assertEqual(pool.get_stats()['discarded'], 1)
+        self.assertEqual(pool.get_stats()['size'], 1)
+
+    def test_recycles_connection_past_max_age(self) -> None:
+        pool = self.get_pool(max_size=1, max_age=60)
+
+        with mock.patch('config.postgresql_pool.pool.time.monotonic', return_value=0):
+            connection = pool.getconn(Connection)
+            pool.putconn(connection)
+
+        with mock.patch('config.postgresql_pool.pool.time.monotonic', return_value=60):
+            self.assertIsNot(pool.getconn(Connection), connection)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.get_stats()['recycled'], 1)
+
+    def test_times_out_when_exhausted(self) -> None:
+        pool = self.get_pool(max_size=1, timeout=0.01)
+        pool.getconn(Connection)
+
+        with self.assertRaises(PoolTimeout):
+            pool.getconn(Connection)
+        self.assertEqual(pool.get_stats()['timeouts'], 1)
+
+    def test_waiter_receives_released_connection(self) -> None:
+        pool = self.get_pool(max_size=1, timeout=5)
+        connection = pool.getconn(Connection)
+        received = []
+
+        waiter = threading.Thread(target=lambda: received.append(pool.getconn(Connection)))
+        waiter.start()
+        pool.putconn(connection)
+        waiter.join()
+
+        self.assertEqual(received, [connection])
+        self.assertEqual(pool.get_stats()['connections'], 1)
+
+    def test_releases_slot_when_connect_fails(self) -> None:
+        pool = self.get_pool(max_size=1)
+
+        with self.assertRaises(ConnectionError):
+            pool.getconn(mock.Mock(side_effect=ConnectionError))
+        self.assertEqual(pool.get_stats()['size'], 0)
+
+
+class JSONRendererTestCase(SimpleTestCase):
+    def get_data(self) -> ReturnDict:
+        return ReturnDict({
+            'results': ReturnList([
+                {
+                    'uuid': uuid.UUID(int=1),
+                    'created_at': datetime(2024, 5, 18, 1, 2, 3, 456, tzinfo=dt_timezone.utc),
+                    'naive': datetime(2024, 5, 18),
+                    'offset': datetime(2024, 5, 18, tzinfo=dt_timezone(timedelta(hours=7))),
+                    'date': date(2024, 5, 18),
+                    'duration': timedelta(days=1, seconds=5),
+                    'amount': Decimal('12.50'),
+                    'label': gettext_lazy('Experience'),
+                    'text': 'Th\u00e9 \u2028 \u2029 \x00 \x1f "quoted" / \\ \U0001f600',
+                    1: [1.5, 0.001, -0.0, 123456789.25, True, None],
+                }
+            ], serializer=None),
+            'count': 1,
+            'next': None,
+        }, serializer=None)
+
+    def test_output_matches_drf_renderer(self) -> None:
+        for data in (self.get_data(), get_page(30), [], {}, 'text', 0):
+            self.assertEqual(
+                fast_renderers.JSONRenderer().render(data, 'application/json'),
+                renderers.JSONRenderer().render(data, 'application/json')
+            )
+
+    def test_falls_back_to_drf_renderer(self) -> None:
+        data = self.get_data()
+        self.assertEqual(
+            fast_renderers.JSONRenderer().render(data, 'application/json; indent=2'),
+            renderers.JSONRenderer().render(data, 'application/json; indent=2')
+        )
+        self.assertEqual(fast_renderers.JSONRenderer().render([2 ** 70], 'application/json'), str([2 ** 70]).encode())
+        self.assertEqual(fast_renderers.JSONRenderer().render(None, 'application/json'), b'')
+
+        with mock.patch.object(fast_renderers, 'orjson', None):
+            self.assertEqual(
+                fast_renderers.JSONRenderer().render(data, 'application/json'),
+                renderers.JSONRenderer().render(data, 'application/json')
+            )
+
+    def test_non_finite_floats_match_drf_renderer(self) -> None:
+        for data in ([math.nan], {'a': [1.5, None, {'b': -math.inf}]}):
+            with self.assertRaises(ValueError):
+                fast_renderers.JSONRenderer().render(data, 'application/json')
+
+            with mock.patch.object(renderers.JSONRenderer, 'strict', False):
+                self.assertEqual(
+                    fast_renderers.JSONRenderer().render(data, 'application/json'),
+                    renderers.JSONRenderer().render(data, 'application/json')
+                )
+
+    def test_exponent_floats_match_drf_renderer(self) -> None:
+        for data in ([1e16], {'a': [1e-05]}, [-2.5e-10, 'e1'], [1.5e300, 9999999999999998.0, 0.0001, 0.0]):
+            self.assertEqual(
+                fast_renderers.JSONRenderer().render(data, 'application/json'),
+                renderers.JSONRenderer().render(data, 'application/json')
+            )
+
+    def test_parser_matches_drf_parser(self) -> None:
+        for content in (b'{"a": [1, 2.5, "th\\u00e9", null]}', '{"\u00e9": 1}'.encode(), b'[-9223372036854775808]'):
+            self.assertEqual(parsers.JSONParser().parse(io.BytesIO(content)), json.loads(content))
+
+        for content in (b'{"a": ', b'[NaN]', b'\xff'):
+            with self.assertRaises(ParseError):
+                parsers.JSONParser().parse(io.BytesIO(content))
+
+
+class LimiterTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.registry = limiters.Registry()
+
+    def get_limiter(self, **kwargs) -> limiters.Limiter:
+        policy = {'limit': 2, 'min_limit': 1, 'max_limit': 4, 'latency': 1.0, 'queue': None, **kwargs}
+        with override_settings(CONCURRENCY_LIMITS={'default': policy}):
+            return self.registry.get_limiter('View.list', 'list')
+
+    def test_sheds_above_limit(self) -> None:
+        limiter = self.get_limiter()
+        self.registry.acquire('View.list', 'list')
+        self.registry.acquire('View.list', 'list')
+
+        with self.assertRaises(limiters.Shed) as context:
+            self.registry.acquire('View.list', 'list')
+        self.assertEqual(context.exception.reason, limiters.CONCURRENCY)
+        self.assertEqual(context.exception.retry_after, 1)
+        self.assertEqual(limiter.shed, {limiters.CONCURRENCY: 1, limiters.QUEUE: 0})
+        self.assertEqual(limiter.in_flight, 2)
+
+    def test_counts_slots_held_by_other_processes(self) -> None:
+        limiter = self.get_limiter()
+        limiters.increment(limiter.key)
+        slot = self.registry.acquire('View.list', 'list')
+
+        with self.assertRaises(limiters.Shed):
+            self.registry.acquire('View.list', 'list')
+
+        limiters.decrement(limiter.key)
+        self.registry.acquire('View.list', 'list')
+        slot.release()
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_sheds_over_queue_budget(self) -> None:
+        limiter = self.get_limiter(queue=2.0)
+        self.registry.acquire('View.list', 'list', 1.5)
+
+        with self.assertRaises(limiters.Shed) as context:
+            self.registry.acquire('View.list', 'list', 2.5)
+        self.assertEqual(context.exception.reason, limiters.QUEUE)
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_limit_grows_when_saturated_and_fast(self) -> None:
+        limiter = self.get_limiter()
+        slot = self.registry.acquire('View.list', 'list')
+        slot.release()
+        self.assertEqual(limiter.limit, 2)
+
+        self.registry.acquire('View.list', 'list')
+        self.registry.acquire('View.list', 'list').release()
+        self.assertEqual(limiter.limit, 2.5)
+
+    def test_limit_shrinks_when_slow(self) -> None:
+        limiter = self.get_limiter(limit=4)
+        for _ in range(20):
+            self.registry.acquire('View.list', 'list')
+            self.registry.release(limiter, 5.0)
+
+        self.assertEqual(limiter.limit, 1)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_queue_time_from_request_start(self) -> None:
+        factory = RequestFactory()
+        started = time.time() - 3
+
+        for value in (f't={started:.3f}', f'{started * 1000:.0f}', f't={started * 1000000:.0f}'):
+            request = factory.get('/', HTTP_X_REQUEST_START=value)
+            self.assertAlmostEqual(limiters.get_queue_time(request), 3, delta=0.5)
+
+        for value in ('', 'soon', 't=inf'):
+            self.assertEqual(limiters.get_queue_time(factory.get('/', HTTP_X_REQUEST_START=value)), 0)
+
+    def test_queue_time_from_arrival(self) -> None:
+        request = RequestFactory().get('/', HTTP_X_REQUEST_START=f't={time.time() - 1:.3f}')
+        request.arrived = time.perf_counter() - 3
+        self.assertAlmostEqual(limiters.get_queue_time(request), 3, delta=0.5)
+
+
+@override_settings(CONCURRENCY_LIMITS={
+    'default': {'limit': 16, 'min_limit': 1, 'max_limit': 64, 'latency': 60.0, 'queue': None},
+    'list': {'limit': 1, 'queue': 2.0},
+})
+class ConcurrencyLimitAPITestCase(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        limiters.registry.clear()
+        self.addCleanup(limiters.registry.clear)
+        self.admin_user = User.objects.create_superuser(
+            username='admin_user',
+            email='admin@example.com',
+            password='admin_password'
+        )
+
+    def test_sheds_busy_view_only(self) -> None:
+        slot = limiters.registry.acquire('ExperienceViewSet.list', 'list')
+
+        response = self.client.get(reverse('experience-list'))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '60')
+
+        self.client.login(username='admin_user', password='admin_password')
+        response = self.client.get(reverse('user-me'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        slot.release()
+        response = self.client.get(reverse('experience-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        content = self.client.get(reverse('metrics')).content.decode()
+        self.assertIn('http_requests_shed_total{view="ExperienceViewSet.list",reason="concurrency"} 1', content)
+        self.assertIn('http_requests_in_flight{view="ExperienceViewSet.list"} 0', content)
+
+    def test_sheds_request_over_queue_budget(self) -> None:
+        response = self.client.get(reverse('experience-list'), HTTP_X_REQUEST_START=f't={time.time() - 5:.3f}')
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        response = self.client.get(reverse('experience-list'), HTTP_X_REQUEST_START=f't={time.time():.3f}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_resolves_view_once(self) -> None:
+        url = reverse('experience-list')
+        with mock.patch.object(URLResolver, 'resolve', autospec=True, side_effect=URLResolver.resolve) as resolve:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([call.args[1] for call in resolve.call_args_list].count(url), 1)
+
+    async def test_async_view_sheds_and_releases(self) -> None:
+        slot = await limiters.registry.aacquire('AsyncExperienceViewSet.list', 'list')
+        response = await self.async_client.get(reverse('async-experience-list'))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        await slot.arelease()
+        response = await self.async_client.get(reverse('async-experience-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(limiters.registry.collect()[0][2], 0)
+
+    def test_streaming_response_holds_slot_until_closed(self) -> None:
+        self.client.login(username='admin_user', password='admin_password')
+        response = self.client.get(reverse('experience-export'))
+        self.assertEqual(limiters.registry.collect()[0][2], 1)
+
+        b''.join(response.streaming_content)
+        self.assertEqual(limiters.registry.collect()[0][2], 0)
+
+
+class MetricsAPITestCase(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.admin_user = User.objects.create_superuser(
+            username='admin_user',
+            email='admin@example.com',
+            password='admin_password'
+        )
+        Experience.objects.create(
+            job_title='Marketing Intern',
+            company_name='Branding Solutions Ltd.',
+            started_month=9,
+            started_year=2019,
+            is_still_in_role=True,
+            created_at=timezone.now(),
+            created_user=self.admin_user,
+            user=self.admin_user
+        )
+
+    def test_response_has_server_timing(self) -> None:
+        response = self.client.get(reverse('experience-list'))
+        timing = {entry.split(';')[0]: entry for entry in response['Server-Timing'].split(', ')}
+        self.assertEqual(set(timing), {'db', 'serializer', 'render', 'total'})
+        self.assertRegex(timing['db'], r'desc="[1-9][0-9]* queries"')
+
+    def test_metrics_by_admin(self) -> None:
+        self.client.get(reverse('experience-list'))
+        self.client.login(username='admin_user', password='admin_password')
+
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        content = response.content.decode()
+        self.assertIn('http_request_duration_seconds_count{view="ExperienceViewSet.list"}', content)
+        self.assertIn('http_request_db_queries_bucket{view="ExperienceViewSet.list",le="+Inf"}', content)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_with_token(self) -> None:
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer wrong')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_metrics_by_anonymous(self) -> None:
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class QueryBudgetTestCase(TestCase):
+    def test_endpoints_stay_within_query_budgets(self) -> None:
+        admin = benchmarks.seed(users=40, experiences=40)
+        results = benchmarks.run(admin, repeat=1)
+
+        self.assertEqual(set(results), set(benchmarks.BUDGETS))
+        self.assertEqual(benchmarks.get_violations(results), {})
+
+
+class CopyTestCase(TestCase):
+    def setUp(self) -> None:
+        benchmarks.seed(users=5, experiences=25)
+        Experience.objects.filter(id__in=Experience.objects.values('id')[:5]).delete()
+        group = Group.objects.create(name='Benchmark')
+        for user in User.objects.all():
+            user.groups.add(group)
+        User.objects.first().user_permissions.add(Permission.objects.first())
+
+    def test_chunk_bounds_cover_soft_deleted_rows(self) -> None:
+        ids = list(Experience.objects_with_deleted.order_by('id').values_list('id', flat=True))
+        self.assertEqual(copies.get_chunk_bound(Experience, 0, 10), ids[9])
+        self.assertEqual(copies.get_chunk_bound(Experience, ids[19], 10), ids[-1])
+        self.assertIsNone(copies.get_chunk_bound(Experience, ids[-1], 10))
+
+    def test_models_include_many_to_many_tables(self) -> None:
+        self.assertEqual(
+            [model._meta.label_lower for model in copies.get_models()],
+            ['accounts.userprofile', 'accounts.userprofile_groups', 'accounts.userprofile_user_permissions',
+             'jobs.experience']
+        )
+
+    @skipUnless(connection.vendor == 'postgresql', 'COPY requires PostgreSQL')
+    def test_export_and_import_round_trip(self) -> None:
+        expected = {
+            model: list(model._base_manager.order_by('pk').values_list())
+            for model in copies.get_models()
+        }
+        pks = [pk for pk, *_ in expected[User]]
+
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = copies.export(directory, batch_size=10)
+            self.assertEqual(len(manifest['models']['jobs.experience']['chunks']), 3)
+
+            Experience._base_manager.all().delete()
+            User.objects.all().delete()
+            with (
+                mock.patch('common.caches.invalidate') as invalidate,
+                mock.patch('apps.accounts.caches.expire_user') as expire_user,
+            ):
+                copies.load(directory)
+            self.assertEqual([call.args[0] for call in invalidate.call_args_list], list(expected))
+            self.assertEqual(sorted(call.args[0] for call in expire_user.call_args_list), pks)
+
+            manifest = copies.read_manifest(directory)
+            manifest['imported'] = manifest['imported'][:1]
+            copies.write_manifest(directory, manifest)
+            messages = []
+            copies.load(directory, log=messages.append)
+            self.assertIn('accounts.userprofile_groups-000001.csv: 0 of 6 rows inserted, 6 already present', messages)
+
+        for model, rows in expected.items():
+            self.assertEqual(list(model._base_manager.order_by('pk').values_list()), rows)
+
+    @skipUnless(connection.vendor == 'postgresql', 'COPY requires PostgreSQL')
+    def test_import_fails_on_conflicting_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            copies.export(directory)
+            Experience._base_manager.all().delete()
+            User.objects.filter(username='benchmark_user_0').update(first_name='Changed')
+
+            with self.assertRaisesMessage(copies.CopyError, 'accounts.userprofile-000001.csv: 1 rows conflict'):
+                copies.load(directory)
+
+            self.assertEqual(copies.read_manifest(directory)['imported'], [])
+            self.assertFalse(Experience._base_manager.exists())
+
+
+class CacheCheckTestCase(SimpleTestCase):
+    def test_response_cache_requires_shared_backend(self) -> None:
+        errors = checks.check_response_cache(None)
+        self.assertEqual([error.id for error in errors], ['common.E001'])
+        self.assertIn('ExperienceViewSet', errors[0].msg)
+
+        with tempfile.TemporaryDirectory() as directory:
+            backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory}
+            with override_settings(CACHES={'default': backend}):
+                self.assertEqual(checks.check_response_cache(None), [])
+
+    def test_concurrency_limits_require_shared_backend(self) -> None:
+        self.assertEqual([error.id for error in checks.check_concurrency_limits(None)], ['common.E002'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory}
+            with override_settings(CACHES={'default': backend}):
+                self.assertEqual(checks.check_concurrency_limits(None), [])
@@ -0,0 +1,114 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+TOTAL = 'total'
+DB = 'db'
+SERIALIZER = 'serializer'
+RENDER = 'render'
+QUERIES = 'queries'
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+current = ContextVar('timings', default=None)
+
+
+class Timings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.label = None
+        self.values = {DB: 0.0, QUERIES: 0, SERIALIZER: 0.0, RENDER: 0.0}
+
+    def add(self, name, value):
+        self.values[name] += value
+
+    def finish(self):
+        self.values[TOTAL] = time.perf_counter() - self.started
+        return self.values
+
+    def get_header(self):
+        entries = [f'{name};dur={self.values[name] * 1000:.1f}' for name in (DB, SERIALIZER, RENDER, TOTAL)]
+        entries[0] += f';desc="{self.values[QUERIES]} queries"'
+        return ', '.join(entries)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, label, value):
+        counts = self.series.get(label)
+        if counts is None:
+            counts = self.series.setdefault(label, [0] * (len(self.buckets) + 1) + [0.0])
+
+        index = bisect_left(self.buckets, value)
+        counts[index] += 1
+        counts[-1] += value
+
+    def collect(self):
+        for label, counts in list(self.series.items()):
+            cumulative = 0
+            buckets = []
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            yield label, buckets, counts[-1]
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {
+            TOTAL: Histogram(SECONDS_BUCKETS),
+            DB: Histogram(SECONDS_BUCKETS),
+            SERIALIZER: Histogram(SECONDS_BUCKETS),
+            RENDER: Histogram(SECONDS_BUCKETS),
+            QUERIES: Histogram(COUNT_BUCKETS),
+        }
+
+    def observe(self, label, values):
+        with self.lock:
+            for name, value in values.items():
+                self.histograms[name].observe(label, value)
+
+    def collect(self):
+        with self.lock:
+            return {name: list(histogram.collect()) for name, histogram in self.histograms.items()}
+
+
+registry = Registry()
+
+
+def add(name, value):
+    timings = current.get()
+    if timings is not None:
+        timings.add(name, value)
+
+
+@contextmanager
+def timed(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(name, time.perf_counter() - started)
+
+
+def record_query(execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings = current.get()
+        if timings is not None:
+            timings.add(DB, time.perf_counter() - started)
+            timings.add(QUERIES, 1)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
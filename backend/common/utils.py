@@ -1,7 +1,22 @@
 import re
 import uuid
+from functools import lru_cache
+
+from common.constants import RETURN_MINIMAL, RETURN_REPRESENTATION
+
+
+@lru_cache(maxsize=None)
+def get_uuid_prefix(class_name: str) -> str:
+    return re.sub(r'([a-z])([A-Z])', r'\1-\2', class_name).upper()
 
 
 def generate_uuid(class_name: str) -> str:
-    kebab_case_class_name = re.sub(r'([a-z])([A-Z])', r'\1-\2', class_name)
-    return f'{kebab_case_class_name.upper()}-{uuid.uuid4()}'
+    return f'{get_uuid_prefix(class_name)}-{uuid.uuid4()}'
+
+
+def get_return_preference(request) -> str:
+    for value in request.headers.get('Prefer', '').split(','):
+        preference = value.split(';')[0].replace(' ', '').lower()
+        if preference in (RETURN_MINIMAL, RETURN_REPRESENTATION):
+            return preference
+    return RETURN_MINIMAL
@@ -0,0 +1,88 @@
+import hmac
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+
+from common import caches, limiters, timings
+from config.postgresql_pool import pool
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+HISTOGRAMS = {
+    timings.TOTAL: ('http_request_duration_seconds', 'Total request time.'),
+    timings.DB: ('http_request_db_seconds', 'Time spent executing SQL.'),
+    timings.QUERIES: ('http_request_db_queries', 'SQL queries executed.'),
+    timings.SERIALIZER: ('http_request_serializer_seconds', 'Time spent serializing.'),
+    timings.RENDER: ('http_request_render_seconds', 'Time spent rendering.'),
+}
+
+
+@require_GET
+def metrics(request):
+    if not is_metrics_authorized(request):
+        return HttpResponseForbidden()
+
+    lines = [*get_histogram_lines(), *get_cache_lines(), *get_limiter_lines(), *get_pool_lines()]
+    return HttpResponse('\n'.join(lines) + '\n', content_type=CONTENT_TYPE)
+
+
+def is_metrics_authorized(request):
+    if request.user.is_authenticated and request.user.is_staff:
+        return True
+
+    token = settings.METRICS_TOKEN
+    authorization = request.headers.get('Authorization', '')
+    return bool(token) and hmac.compare_digest(authorization, f'Bearer {token}')
+
+
+def get_histogram_lines():
+    collected = timings.registry.collect()
+
+    for key, (name, description) in HISTOGRAMS.items():
+        yield f'# HELP {name} {description}'
+        yield f'# TYPE {name} histogram'
+        for label, buckets, total in collected[key]:
+            for bound, count in buckets:
+                yield f'{name}_bucket{{view="{label}",le="{bound}"}} {count}'
+            yield f'{name}_sum{{view="{label}"}} {total}'
+            yield f'{name}_count{{view="{label}"}} {buckets[-1][1]}'
+
+
+def get_cache_lines():
+    yield '# HELP response_cache_requests_total Cached response lookups.'
+    yield '# TYPE response_cache_requests_total counter'
+    for model in apps.get_models():
+        for result, value in caches.get_stats(model).items():
+            if value:
+                yield f'response_cache_requests_total{{model="{model._meta.label_lower}",result="{result}"}} {value}'
+
+
+def get_limiter_lines():
+    collected = limiters.registry.collect()
+
+    yield '# HELP http_requests_shed_total Requests rejected with 503 by the concurrency limiter.'
+    yield '# TYPE http_requests_shed_total counter'
+    for label, _, _, shed in collected:
+        for reason, value in shed.items():
+            yield f'http_requests_shed_total{{view="{label}",reason="{reason}"}} {value}'
+
+    yield '# HELP http_concurrency_limit Current adaptive concurrency limit.'
+    yield '# TYPE http_concurrency_limit gauge'
+    for label, limit, _, _ in collected:
+        yield f'http_concurrency_limit{{view="{label}"}} {int(limit)}'
+
+    yield '# HELP http_requests_in_flight Requests currently holding a concurrency slot in any process.'
+    yield '# TYPE http_requests_in_flight gauge'
+    for label, _, in_flight, _ in collected:
+        yield f'http_requests_in_flight{{view="{label}"}} {in_flight}'
+
+
+def get_pool_lines():
+    stats = pool.get_stats()
+
+    for name in dict.fromkeys(name for values in stats.values() for name in values):
+        yield f'# TYPE database_pool_{name} gauge'
+        for alias, values in stats.items():
+            yield f'database_pool_{name}{{alias="{alias}"}} {values[name]}'
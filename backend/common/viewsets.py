@@ -1,18 +1,32 @@
 from rest_framework import viewsets
 
 from common.mixins import (
+    AsyncViewSetMixin,
+    LazyAuthenticationMixin,
     CreateModelMixin,
     UpdateModelMixin,
     DestroyModelMixin,
-    ReadWritableSerializerMixin
+    ReadWritableSerializerMixin,
+    CacheResponseMixin,
+    ConditionalGetMixin,
+    SoftDeleteModelMixin
 )
 
 
 class ModelViewSet(
+    LazyAuthenticationMixin,
     CreateModelMixin,
     UpdateModelMixin,
     DestroyModelMixin,
+    SoftDeleteModelMixin,
+    CacheResponseMixin,
+    ConditionalGetMixin,
     ReadWritableSerializerMixin,
     viewsets.ModelViewSet
 ):
     lookup_field = 'uuid'
+    conditional_fields = ('created_at', 'updated_at')
+
+
+class AsyncModelViewSet(AsyncViewSetMixin, ModelViewSet):
+    pass
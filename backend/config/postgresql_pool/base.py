@@ -0,0 +1,61 @@
+from django.db.backends.postgresql import base, creation
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from config.postgresql_pool import pool
+
+
+def close_connection(connection):
+    connection.close()
+
+
+def check_connection(connection):
+    if connection.closed:
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    return True
+
+
+def reset_connection(connection):
+    if connection.closed:
+        return False
+
+    connection.rollback()
+    return True
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        pool.close_idle()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def get_pool(self, conn_params):
+        options = self.settings_dict.get('POOL', {})
+        return pool.get_pool(
+            self.alias,
+            repr(sorted(conn_params.items())),
+            close=close_connection,
+            check=check_connection,
+            reset=reset_connection,
+            max_size=options.get('MAX_SIZE', 10),
+            max_age=options.get('MAX_AGE', 1800),
+            timeout=options.get('TIMEOUT', 10),
+            check_interval=options.get('CHECK_INTERVAL', 0),
+        )
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        self.isolation_level = IsolationLevel(
+            self.settings_dict['OPTIONS'].get('isolation_level', IsolationLevel.READ_COMMITTED)
+        )
+        return self.pool.getconn(lambda: super(DatabaseWrapper, self).get_new_connection(conn_params))
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.putconn(self.connection)
@@ -0,0 +1,197 @@
+import os
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+pools = {}
+pools_lock = threading.Lock()
+
+
+class PoolTimeout(OperationalError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, close, check=None, reset=None, max_size=10, max_age=1800, timeout=10, check_interval=0):
+        self.close = close
+        self.check = check
+        self.reset = reset
+        self.max_size = max_size
+        self.max_age = max_age
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.condition = threading.Condition()
+        self.idle = deque()
+        self.in_use = {}
+        self.size = 0
+        self.waiting = 0
+        self.counters = {
+            'connections': 0,
+            'recycled': 0,
+            'discarded': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'timeouts': 0,
+        }
+
+    def getconn(self, connect):
+        while True:
+            entry = self.acquire()
+            if entry is None:
+                return self.open(connect)
+
+            connection, created_at, released_at = entry
+            if self.is_healthy(connection, released_at):
+                self.in_use[id(connection)] = created_at
+                return connection
+            self.discard(connection)
+
+    def acquire(self):
+        started = time.monotonic()
+        expired = []
+        waited = False
+
+        with self.condition:
+            try:
+                while True:
+                    while self.idle:
+                        connection, created_at, released_at = self.idle.pop()
+                        if not self.is_expired(created_at):
+                            return connection, created_at, released_at
+                        expired.append(connection)
+                        self.size -= 1
+                        self.counters['recycled'] += 1
+
+                    if self.size < self.max_size:
+                        self.size += 1
+                        return None
+
+                    remaining = self.timeout - (time.monotonic() - started)
+                    if remaining <= 0:
+                        self.counters['timeouts'] += 1
+                        raise PoolTimeout(f'No connection available within {self.timeout} seconds.')
+
+                    waited = True
+                    self.waiting += 1
+                    self.condition.wait(remaining)
+                    self.waiting -= 1
+            finally:
+                if waited:
+                    self.counters['waits'] += 1
+                    self.counters['wait_seconds'] += time.monotonic() - started
+
+                for connection in expired:
+                    self.close(connection)
+
+    def open(self, connect):
+        try:
+            connection = connect()
+        except BaseException:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.counters['connections'] += 1
+        self.in_use[id(connection)] = time.monotonic()
+        return connection
+
+    def putconn(self, connection, discard=False):
+        created_at = self.in_use.pop(id(connection), None)
+        if created_at is None:
+            self.close(connection)
+            return
+
+        expired = self.is_expired(created_at)
+        if discard or expired or not self.is_reset(connection):
+            with self.condition:
+                self.size -= 1
+                self.counters['recycled' if expired and not discard else 'discarded'] += 1
+                self.condition.notify()
+            self.close(connection)
+            return
+
+        with self.condition:
+            self.idle.append((connection, created_at, time.monotonic()))
+            self.condition.notify()
+
+    def discard(self, connection):
+        with self.condition:
+            self.size -= 1
+            self.counters['discarded'] += 1
+            self.condition.notify()
+        self.close(connection)
+
+    def is_expired(self, created_at):
+        return self.max_age is not None and time.monotonic() - created_at >= self.max_age
+
+    def is_healthy(self, connection, released_at):
+        if self.check is None or time.monotonic() - released_at < self.check_interval:
+            return True
+
+        try:
+            return self.check(connection)
+        except Exception:
+            return False
+
+    def is_reset(self, connection):
+        if self.reset is None:
+            return True
+
+        try:
+            return self.reset(connection)
+        except Exception:
+            return False
+
+    def close_idle(self):
+        with self.condition:
+            idle = [connection for connection, _, _ in self.idle]
+            self.idle.clear()
+            self.size -= len(idle)
+            self.condition.notify_all()
+
+        for connection in idle:
+            self.close(connection)
+
+    def get_stats(self):
+        with self.condition:
+            return {
+                'size': self.size,
+                'max_size': self.max_size,
+                'in_use': self.size - len(self.idle),
+                'idle': len(self.idle),
+                'waiting': self.waiting,
+                **self.counters,
+            }
+
+
+def get_pool(alias, key, **kwargs):
+    pool_key = (os.getpid(), alias, key)
+    with pools_lock:
+        if pool_key not in pools:
+            pools[pool_key] = ConnectionPool(**kwargs)
+        return pools[pool_key]
+
+
+def get_pools():
+    pid = os.getpid()
+    with pools_lock:
+        return [(alias, pool) for (pool_pid, alias, _), pool in pools.items() if pool_pid == pid]
+
+
+def get_stats():
+    stats = {}
+    for alias, pool in get_pools():
+        for name, value in pool.get_stats().items():
+            stats.setdefault(alias, {}).setdefault(name, 0)
+            stats[alias][name] += value
+    return stats
+
+
+def close_idle(alias=None):
+    for pool_alias, pool in get_pools():
+        if alias is None or pool_alias == alias:
+            pool.close_idle()
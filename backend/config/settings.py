@@ -14,6 +14,8 @@ from pathlib import Path
 
 import environ
 
+from common.constants import EXPORT, LIST, RETRIEVE
+
 env = environ.Env()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -51,6 +53,7 @@ THIRD_PARTY_APPS = [
 ]
 
 LOCAL_APPS = [
+    'common',
     'apps.accounts',
     'apps.jobs',
 ]
@@ -58,16 +61,19 @@ LOCAL_APPS = [
 INSTALLED_APPS += THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    'common.middleware.ServerTimingMiddleware',
+    'common.middleware.ConcurrencyLimitMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.accounts.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'config.urls'
+# The ASGI service sets ROOT_URLCONF=config.urls_async so it only serves /api/v1/async/
+ROOT_URLCONF = env.str('ROOT_URLCONF', default='config.urls')
 
 TEMPLATES = [
     {
@@ -94,6 +100,26 @@ DATABASES = {
     'default': env.db(),
 }
 
+if env.bool('DATABASE_POOL', default=False):
+    DATABASES['default']['ENGINE'] = 'config.postgresql_pool'
+    DATABASES['default']['POOL'] = {
+        'MAX_SIZE': env.int('DATABASE_POOL_MAX_SIZE', default=10),
+        'MAX_AGE': env.int('DATABASE_POOL_MAX_AGE', default=1800),
+        'TIMEOUT': env.float('DATABASE_POOL_TIMEOUT', default=10),
+        'CHECK_INTERVAL': env.float('DATABASE_POOL_CHECK_INTERVAL', default=0),
+    }
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Cached responses are invalidated through generation counters, so deployments with several workers need a shared
+# backend (`check --deploy` fails on a process-local one). Token revocations live in their own alias, which must be
+# shared as well, so response-cache culling or flushes never drop them
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+    'tokens': env.cache('TOKEN_CACHE_URL', default='locmemcache://tokens'),
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -148,12 +174,60 @@ AUTH_USER_MODEL = 'accounts.UserProfile'
 # https://www.django-rest-framework.org/api-guide/settings/
 
 REST_FRAMEWORK = {
-    'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.SessionAuthentication',
+        'apps.accounts.authentication.SignedTokenAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+    ],
+    'DEFAULT_FILTER_BACKENDS': [
+        'django_filters.rest_framework.DjangoFilterBackend',
+        'common.filters.FullTextSearchFilter',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'common.paginations.PageNumberPagination',
+    'DEFAULT_PARSER_CLASSES': [
+        'common.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.IsAdminUser'],
+    'DEFAULT_RENDERER_CLASSES': [
+        'common.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'PAGE_SIZE': 30,
 }
 
+# Signed API tokens
+# Issued by `POST /api/v1/tokens/`, sent as `Authorization: Bearer <token>` and valid for this many seconds
+
+SIGNED_TOKEN_MAX_AGE = env.int('SIGNED_TOKEN_MAX_AGE', default=900)
+
+# Per-process cache of session-authenticated users
+# Entries carry a per-user version kept in the default (shared) cache; user save/delete, M2M changes, login and
+# logout in any process bump it, so stale entries are dropped on their next hit
+
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=30)
+AUTH_USER_CACHE_MAX_SIZE = env.int('AUTH_USER_CACHE_MAX_SIZE', default=10000)
+
+# Adaptive per-view concurrency limits, keyed by viewset action with `default` as the fallback
+# `limit` adapts between `min_limit` and `max_limit` around the `latency` target (seconds) and caps the requests in
+# flight across all workers, counted in the default (shared) cache; requests that waited longer than `queue` seconds
+# before their view runs are shed.
+# The front proxy must set `X-Request-Start` to the time it received the request (nginx:
+# `proxy_set_header X-Request-Start "t=${msec}";`), otherwise only the time spent inside the worker is seen
+
+CONCURRENCY_LIMITS = {
+    'default': {'limit': 16, 'min_limit': 2, 'max_limit': 64, 'latency': 1.0, 'queue': 5.0},
+    LIST: {'limit': 8, 'max_limit': 32, 'latency': 0.5, 'queue': 2.0},
+    RETRIEVE: {'limit': 32, 'max_limit': 128, 'latency': 0.25},
+    EXPORT: {'limit': 2, 'min_limit': 1, 'max_limit': 4, 'latency': 30.0, 'queue': 2.0},
+}
+
+# Metrics endpoint
+# Readable by staff sessions or with `Authorization: Bearer <METRICS_TOKEN>`
+
+METRICS_TOKEN = env.str('METRICS_TOKEN', default='')
+
 # Django debug toolbar configuration
 # https://django-debug-toolbar.readthedocs.io/en/latest/installation.html
 
@@ -11,17 +11,19 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework import routers
 
-from apps.accounts.views import UserViewSet
+from apps.accounts.views import TokenViewSet, UserViewSet
 from apps.jobs.views import ExperienceViewSet
 
 router = routers.DefaultRouter()
 router.register(r'experiences', ExperienceViewSet, 'experience')
 router.register(r'users', UserViewSet, 'user')
+router.register(r'tokens', TokenViewSet, 'token')
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api-auth/', include('rest_framework.urls')),
     path('api/v1/', include(router.urls)),
+    path('', include('config.urls_async')),
 ]
 
 if settings.DEBUG:
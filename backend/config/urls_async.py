@@ -0,0 +1,21 @@
+"""
+URL configuration for the ASGI service.
+
+Only the async viewsets and the per-process metrics are routed here; the sync API stays on the WSGI service.
+"""
+
+from django.urls import path, include
+from rest_framework import routers
+
+from apps.accounts.views import AsyncUserViewSet
+from apps.jobs.views import AsyncExperienceViewSet
+from common.views import metrics
+
+async_router = routers.DefaultRouter()
+async_router.register(r'experiences', AsyncExperienceViewSet, 'async-experience')
+async_router.register(r'users', AsyncUserViewSet, 'async-user')
+
+urlpatterns = [
+    path('api/v1/async/', include(async_router.urls)),
+    path('metrics', metrics, name='metrics'),
+]